@@ -5,26 +5,79 @@ Contains the definitions of Flesh and Blood cards and card lists.
 from __future__ import annotations
 
 import csv
-import copy
 import dataclasses
+import functools
 import io
+import itertools
 import json
+import operator
 import os
 import random
+import re
+import sys
 
-from collections import UserList
-from IPython.display import display, Image, Markdown
+import numpy as np
+
+from collections import Counter, UserList, defaultdict
 from pandas import DataFrame, Series
-from statistics import mean, median, stdev
-from typing import Any, Optional
+from typing import Any, Callable, ClassVar, Iterable, Optional
 from unidecode import unidecode
 
 from .meta import GAME_FORMATS, ICON_CODE_IMAGE_URLS, RARITIES
 
 CARD_CATALOG: Optional[CardList] = None
 
+CSV_FALSE_STRINGS: frozenset[str] = frozenset({
+    'false',
+    'no',
+})
+
+GROUP_FIELDS: dict[str, str] = {
+    'cost': 'cost',
+    'defense': 'defense',
+    'full_name': 'full_name',
+    'grants': 'grants',
+    'health': 'health',
+    'intelligence': 'intelligence',
+    'keyword': 'keywords',
+    'keywords': 'keywords',
+    'name': 'name',
+    'pitch': 'pitch',
+    'power': 'power',
+    'rarities': 'rarities',
+    'rarity': 'rarities',
+    'set': 'sets',
+    'sets': 'sets',
+    'type': 'types',
+    'type_text': 'type_text',
+    'types': 'types',
+}
+
+INTERNED_FIELDS: frozenset[str] = frozenset({
+    'grants',
+    'keywords',
+    'rarities',
+    'sets',
+    'types',
+})
+
 JSON_INDENT: Optional[int] = 2
 
+OPTIONAL_INT_FIELDS: frozenset[str] = frozenset({
+    'health',
+    'intelligence',
+    'pitch',
+})
+
+PITCH_COLORS: dict[str, int] = {
+    'b': 3,
+    'blue': 3,
+    'r': 1,
+    'red': 1,
+    'y': 2,
+    'yellow': 2,
+}
+
 RARITY_VALUE: dict[str, int] = {
     'P': 0,
     'T': 1,
@@ -36,8 +89,214 @@ RARITY_VALUE: dict[str, int] = {
     'F': 7,
 }
 
+RARITY_NAMES: tuple[str, ...] = tuple(RARITIES[r] for r in sorted(RARITY_VALUE, key=RARITY_VALUE.get))
+
+RENDER_ATTRIBUTES: tuple[tuple[str, str], ...] = (
+    ('Attack Power', 'power'),
+    ('Defense', 'defense'),
+    ('Health', 'health'),
+    ('Intelligence', 'intelligence'),
+    ('Pitch Value', 'pitch'),
+    ('Resource Cost', 'cost'),
+)
+
+STRING_FIELDS: frozenset[str] = frozenset({
+    'body',
+    'flavor_text',
+    'full_name',
+    'name',
+    'type_text',
+})
+
+STRING_LIST_FIELDS: frozenset[str] = frozenset({
+    'grants',
+    'identifiers',
+    'image_urls',
+    'keywords',
+    'rarities',
+    'sets',
+    'tags',
+    'types',
+})
+
 TCGPLAYER_BASE_URL = 'https://www.tcgplayer.com/search/flesh-and-blood-tcg/product?q='
 
+TYPE_BITS: dict[str, int] = {
+    'Action': 1 << 0,
+    'Attack': 1 << 1,
+    'Attack Reaction': 1 << 2,
+    'Aura': 1 << 3,
+    'Defense Reaction': 1 << 4,
+    'Equipment': 1 << 5,
+    'Hero': 1 << 6,
+    'Instant': 1 << 7,
+    'Item': 1 << 8,
+    'Token': 1 << 9,
+    'Weapon': 1 << 10,
+}
+
+VALUE_FIELDS: frozenset[str] = frozenset({
+    'cost',
+    'defense',
+    'health',
+    'intelligence',
+    'pitch',
+    'power',
+})
+
+def _csv_image_urls(inputstr: str) -> list[str]:
+    '''
+    Parses the list of image URLs out of the `Image URLs` column of a card CSV
+    file.
+
+    Args:
+      inputstr: The raw contents of the column.
+
+    Returns:
+      The `list` of image URLs.
+    '''
+    if not inputstr: return []
+    inputstr = unidecode(inputstr)
+    if ',' in inputstr:
+        return [x.split(' - ', 1)[0].strip() for x in inputstr.split(',') if ' - ' in x]
+    elif ' - ' in inputstr:
+        return [inputstr.split(' - ', 1)[0].strip()]
+    return []
+
+def _csv_int_str_or_none(inputstr: str) -> int | str | None:
+    '''
+    Parses a card CSV column which may contain an integer value, a variable
+    value (like `X`), or nothing (like `Cost`).
+
+    Args:
+      inputstr: The raw contents of the column.
+
+    Returns:
+      The `int` value of the column if possible, otherwise its `str` value (or `None` if empty).
+    '''
+    if not inputstr:
+        return None
+    elif inputstr.isdigit():
+        return int(inputstr)
+    else:
+        return inputstr
+
+def _csv_legality(row: list[str], indices: tuple[int, ...]) -> dict[str, bool]:
+    '''
+    Parses the legality of a card from the legality columns of a card CSV row.
+
+    Args:
+      row: The CSV row to parse.
+      indices: The indices of the `Blitz Legal`, `Blitz Living Legend`, `Blitz Banned`, `CC Legal`, `CC Living Legend`, `CC Banned`, `Commoner Legal`, and `Commoner Banned` columns (in that order).
+
+    Returns:
+      The legality `dict` of the card.
+    '''
+    blitz_legal, blitz_ll, blitz_banned, cc_legal, cc_ll, cc_banned, commoner_legal, commoner_banned = [row[i] for i in indices]
+    res = {}
+    res['B'] = not blitz_legal.lower() in CSV_FALSE_STRINGS and not blitz_ll and not blitz_banned
+    res['CC'] = not cc_legal.lower() in CSV_FALSE_STRINGS and not cc_ll and not cc_banned
+    res['C'] = not commoner_legal.lower() in CSV_FALSE_STRINGS and not commoner_banned
+    res['UPF'] = res['CC']
+    return res
+
+@functools.lru_cache(maxsize=None)
+def _icon_code_regex() -> re.Pattern:
+    '''
+    Compiles a regular expression matching any of the icon codes in
+    `meta.ICON_CODE_IMAGE_URLS`.
+
+    Note:
+      The expression is only compiled the first time it is needed, and is
+      then reused. Longer codes are tried first, so that a code is never
+      shadowed by another code which is a prefix of it.
+
+    Returns:
+      The compiled regular expression.
+    '''
+    return re.compile('|'.join(re.escape(k) for k in sorted(ICON_CODE_IMAGE_URLS, key=len, reverse=True)))
+
+@functools.lru_cache(maxsize=8)
+def _icon_images(icon_size: int) -> dict[str, str]:
+    '''
+    Builds the HTML images which replace each of the icon codes in
+    `meta.ICON_CODE_IMAGE_URLS` for the specified icon size.
+
+    Note:
+      Only a handful of icon sizes are used in practice, so the images for the
+      most recently used sizes are cached.
+
+    Args:
+      icon_size: The target width of icon images.
+
+    Returns:
+      A `dict` mapping each icon code to its HTML image.
+    '''
+    return {k: f'<img src="{v}" alt="{k}" width="{icon_size}"/>' for k, v in ICON_CODE_IMAGE_URLS.items()}
+
+def json_default(obj: Any) -> Any:
+    '''
+    Serializes the `Card` and `CardList` objects encountered by `json.dumps()`,
+    so that card lists can be encoded without first being converted to a list
+    of dictionaries.
+
+    Note:
+      Pass this function as the `default` argument of `json.dump()` or
+      `json.dumps()` when encoding data containing cards.
+
+    Args:
+      obj: The object `json` could not serialize by itself.
+
+    Returns:
+      A JSON-serializable representation of the object.
+    '''
+    if isinstance(obj, Card): return obj._to_json_dict()
+    if isinstance(obj, CardList): return obj.data
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _render_icons(text: str, icon_size: int) -> str:
+    '''
+    Replaces the icon codes within the specified text with HTML images (see
+    `meta.ICON_CODE_IMAGE_URLS`).
+
+    Args:
+      text: The text to render icons within.
+      icon_size: The target width of icon images.
+
+    Returns:
+      The text with icon codes replaced.
+    '''
+    images = _icon_images(icon_size)
+    return _icon_code_regex().sub(lambda m: images[m.group(0)], text)
+
+def _value_arrays(field: str, raw: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Converts the raw values of a numeric `Card` field into the arrays cached
+    by `CardList._value_column()`.
+
+    Note:
+      Fields in `OPTIONAL_INT_FIELDS` only ever hold an `int` or `None`, so
+      their values are converted by NumPy directly (`None` becoming `NaN`)
+      instead of checking the type of each value.
+
+    Args:
+      field: The numeric `Card` field the values belong to (see `VALUE_FIELDS`).
+      raw: The values of the field.
+
+    Returns:
+      An `int64` array of the values, along with a `bool` array indicating
+      which of those values are actually integers.
+    '''
+    if field in OPTIONAL_INT_FIELDS:
+        floats = np.array(raw, dtype=np.float64)
+        valid = ~np.isnan(floats)
+        floats[~valid] = 0
+        return floats.astype(np.int64), valid
+    valid = np.array([type(v) is int for v in raw], dtype=bool)
+    values = np.array([v if type(v) is int else 0 for v in raw], dtype=np.int64)
+    return values, valid
+
+
 @dataclasses.dataclass
 class Card:
     '''
@@ -49,6 +308,17 @@ class Card:
       between prints, it can be assumed that `fab` lists the latest print of the
       card.
 
+    Note:
+      Some values derived from the fields of a card (such as its hash and
+      pitch color) are computed once when the card is constructed, so `Card`
+      objects should be treated as read-only. Use `dataclasses.replace()` to
+      obtain a modified copy of a card.
+
+    Note:
+      Unlike `cost`, `defense`, and `power`, the `health`, `intelligence`, and
+      `pitch` fields never hold variable (`str`) values, which `CardList`
+      relies on when computing statistics (see `OPTIONAL_INT_FIELDS`).
+
     Attributes:
       body: The full body text of the card, excluding flavor text.
       cost: The resource cost of the card.
@@ -93,6 +363,43 @@ class Card:
     type_text: str
     types: list[str]
 
+    # `dataclass(slots=True)` requires Python 3.10, so the slots (including
+    # those of values derived in `__post_init__`) are declared manually.
+    __slots__ = (
+        'body',
+        'cost',
+        'defense',
+        'flavor_text',
+        'full_name',
+        'grants',
+        'health',
+        'identifiers',
+        'image_urls',
+        'intelligence',
+        'keywords',
+        'legality',
+        'name',
+        'pitch',
+        'power',
+        'rarities',
+        'sets',
+        'tags',
+        'type_text',
+        'types',
+        '_any_banned',
+        '_body_lower',
+        '_full_name_lower',
+        '_hash',
+        '_name_lower',
+        '_pitch_color',
+        '_rarity_idx',
+        '_specialization',
+        '_type_text_lower',
+        '_types_mask',
+    )
+
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]
+
     def __getitem__(self, key: str) -> Any:
         '''
         Allows one to access fields of a card via dictionary syntax.
@@ -103,7 +410,8 @@ class Card:
         Returns:
           The value associated with the specified field.
         '''
-        return self.__dict__[key]
+        if not key in Card._FIELD_NAMES: raise KeyError(key)
+        return getattr(self, key)
 
     def __hash__(self) -> Any:
         '''
@@ -112,7 +420,31 @@ class Card:
         Returns:
           The hash representation of the card.
         '''
-        return hash((self.name, self.pitch, self.type_text))
+        return self._hash
+
+    def __post_init__(self):
+        '''
+        Computes values derived from the fields of the card.
+        '''
+        self._any_banned = False in self.legality.values()
+        self._body_lower = str(self.body).lower()
+        self._full_name_lower = self.full_name.lower()
+        self._hash = hash((self.name, self.pitch, self.type_text))
+        self._name_lower = self.name.lower()
+        self._pitch_color = 0 if self.pitch is None else self.pitch
+        if all(r in RARITY_VALUE for r in self.rarities):
+            self._rarity_idx = bytes(RARITY_VALUE[r] for r in self.rarities)
+        else:
+            self._rarity_idx = None
+        self._specialization = next(
+            (k.replace('Specialization', '').strip().lower() for k in self.keywords if 'Specialization' in k),
+            None
+        )
+        types_mask = 0
+        for t in self.types:
+            types_mask |= TYPE_BITS.get(t, 0)
+        self._type_text_lower = self.type_text.lower()
+        self._types_mask = types_mask
 
     def __str__(self) -> str:
         '''
@@ -125,6 +457,60 @@ class Card:
         '''
         return self.to_json()
 
+    def _clone(self) -> Card:
+        '''
+        Creates a copy of this card without the overhead of `copy.deepcopy()`.
+
+        Note:
+          Each `list` field and the `legality` dictionary are copied, while
+          all other fields are immutable and are shared with this card.
+
+        Returns:
+          A new `Card` object equal to this card.
+        '''
+        return Card(
+            body         = self.body,
+            cost         = self.cost,
+            defense      = self.defense,
+            flavor_text  = self.flavor_text,
+            full_name    = self.full_name,
+            grants       = self.grants.copy(),
+            health       = self.health,
+            identifiers  = self.identifiers.copy(),
+            image_urls   = self.image_urls.copy(),
+            intelligence = self.intelligence,
+            keywords     = self.keywords.copy(),
+            legality     = self.legality.copy(),
+            name         = self.name,
+            pitch        = self.pitch,
+            power        = self.power,
+            rarities     = self.rarities.copy(),
+            sets         = self.sets.copy(),
+            tags         = self.tags.copy(),
+            type_text    = self.type_text,
+            types        = self.types.copy()
+        )
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> Card:
+        '''
+        Creates a new card from its raw python dictionary representation.
+
+        Args:
+          data: A `dict` containing exactly the fields of the card.
+
+        Returns:
+          A new `Card` object.
+        '''
+        # Misnamed or missing fields fall back to keyword construction, so
+        # that they are reported by the constructor as a `TypeError`.
+        if len(data) == len(Card._FIELD_NAMES):
+            try:
+                return Card(*map(data.__getitem__, Card._FIELD_NAMES))
+            except KeyError:
+                pass
+        return Card(**data)
+
     @staticmethod
     def from_full_name(full_name: str, catalog: Optional[CardList] = None) -> Card:
         '''
@@ -143,10 +529,10 @@ class Card:
         '''
         _catalog = CARD_CATALOG if catalog is None else catalog
         if _catalog is None: raise Exception('specified card catalog has not been initialized')
-        grouped = _catalog.group(by='full_name')
-        if not full_name in grouped:
+        index = _catalog._full_name_index()
+        if not full_name in index:
             raise Exception(f'specified card catalog does not contain a card will full name "{full_name}"')
-        return copy.deepcopy(grouped[full_name][0])
+        return index[full_name]._clone()
 
     @staticmethod
     def from_identifier(identifier: str, catalog: Optional[CardList] = None) -> Card:
@@ -166,9 +552,9 @@ class Card:
         '''
         _catalog = CARD_CATALOG if catalog is None else catalog
         if _catalog is None: raise Exception('specified card catalog has not been initialized')
-        for card in _catalog:
-            if identifier in card.identifiers:
-                return copy.deepcopy(card)
+        index = _catalog._identifier_index()
+        if identifier in index:
+            return index[identifier]._clone()
         raise Exception(f'no card in catalog found with identifier "{identifier}"')
 
     @staticmethod
@@ -182,7 +568,7 @@ class Card:
         Returns:
           A new `Card` object.
         '''
-        return Card(**json.loads(jsonstr))
+        return Card.from_dict(json.loads(jsonstr))
 
     def image(self, height: int = 314, index: int = -1, width: int = 225) -> Any:
         '''
@@ -198,6 +584,7 @@ class Card:
           The image representation of the card.
         '''
         if not self.image_urls: return 'No images available'
+        from IPython.display import display, Image
         return display(Image(self.image_urls[index], height=height, width=width))
 
     def is_action(self) -> bool:
@@ -207,7 +594,7 @@ class Card:
         Returns:
           Whether the card contains the _Action_ type.
         '''
-        return 'Action' in self.types
+        return bool(self._types_mask & TYPE_BITS['Action'])
 
     def is_attack(self) -> bool:
         '''
@@ -216,7 +603,7 @@ class Card:
         Returns:
           Whether the card contains the _Attack_ type.
         '''
-        return 'Attack' in self.types
+        return bool(self._types_mask & TYPE_BITS['Attack'])
 
     def is_attack_reaction(self) -> bool:
         '''
@@ -225,7 +612,7 @@ class Card:
         Returns:
           Whether the card contains the _Attack Reaction_ type.
         '''
-        return 'Attack Reaction' in self.types
+        return bool(self._types_mask & TYPE_BITS['Attack Reaction'])
 
     def is_aura(self) -> bool:
         '''
@@ -234,7 +621,7 @@ class Card:
         Returns:
           Whether the card contains the _Aura_ type.
         '''
-        return 'Aura' in self.types
+        return bool(self._types_mask & TYPE_BITS['Aura'])
 
     def is_blue(self) -> bool:
         '''
@@ -243,7 +630,7 @@ class Card:
         Returns:
           Whether this card pitches for 3 resources.
         '''
-        return self.pitch == 3 if isinstance(self.pitch, int) else False
+        return self._pitch_color == 3
 
     def is_defense_reaction(self) -> bool:
         '''
@@ -252,7 +639,7 @@ class Card:
         Returns:
           Whether the card contains the _Defense Reaction_ type.
         '''
-        return 'Defense Reaction' in self.types
+        return bool(self._types_mask & TYPE_BITS['Defense Reaction'])
 
     def is_equipment(self) -> bool:
         '''
@@ -261,7 +648,7 @@ class Card:
         Returns:
           Whether the card contains the _Equipment_ type.
         '''
-        return 'Equipment' in self.types
+        return bool(self._types_mask & TYPE_BITS['Equipment'])
 
     def is_hero(self) -> bool:
         '''
@@ -270,7 +657,7 @@ class Card:
         Returns:
           Whether the card contains the _Hero_ type.
         '''
-        return 'Hero' in self.types
+        return bool(self._types_mask & TYPE_BITS['Hero'])
 
     def is_instant(self) -> bool:
         '''
@@ -279,7 +666,7 @@ class Card:
         Returns:
           Whether the card contains the _Instant_ type.
         '''
-        return 'Instant' in self.types
+        return bool(self._types_mask & TYPE_BITS['Instant'])
 
     def is_item(self) -> bool:
         '''
@@ -288,13 +675,17 @@ class Card:
         Returns:
           Whether the card contains the _Item_ type.
         '''
-        return 'Item' in self.types
+        return bool(self._types_mask & TYPE_BITS['Item'])
 
     def is_legal(self, format: Optional[str] = None) -> bool:
         '''
         Whether this card is legal for the specified format, or if `format` is
         `None`, returns `False` if this card is banned in _any_ format.
 
+        Note:
+          Cards are considered legal in any format missing from their
+          `legality` field.
+
         Args:
           format: The code of the card format to check, or `None` to check all formats.
 
@@ -303,9 +694,9 @@ class Card:
         '''
         if not self.legality: return True
         if format is None:
-            return False in self.legality.values()
+            return self._any_banned
         else:
-            return self.legality[format]
+            return self.legality.get(format, True)
 
     def is_reaction(self) -> bool:
         '''
@@ -314,7 +705,7 @@ class Card:
         Returns:
           Whether the card contains the _Attack Reaction_ or _Defense Reaction_ types.
         '''
-        return self.is_attack_reaction() or self.is_defense_reaction()
+        return bool(self._types_mask & (TYPE_BITS['Attack Reaction'] | TYPE_BITS['Defense Reaction']))
 
     def is_red(self) -> bool:
         '''
@@ -323,7 +714,7 @@ class Card:
         Returns:
           Whether this card pitches for 1 resource.
         '''
-        return self.pitch == 1 if isinstance(self.pitch, int) else False
+        return self._pitch_color == 1
 
     def is_token(self) -> bool:
         '''
@@ -332,7 +723,7 @@ class Card:
         Returns:
           Whether the card contains the _Token_ type.
         '''
-        return 'Token' in self.types
+        return bool(self._types_mask & TYPE_BITS['Token'])
 
     def is_weapon(self) -> bool:
         '''
@@ -341,7 +732,7 @@ class Card:
         Returns:
           Whether the card contains the _Weapon_ type.
         '''
-        return 'Weapon' in self.types
+        return bool(self._types_mask & TYPE_BITS['Weapon'])
 
     def is_yellow(self) -> bool:
         '''
@@ -350,7 +741,7 @@ class Card:
         Returns:
           Whether this card pitches for 2 resources.
         '''
-        return self.pitch == 2 if isinstance(self.pitch, int) else False
+        return self._pitch_color == 2
 
     def keys(self) -> list[str]:
         '''
@@ -359,7 +750,7 @@ class Card:
         Returns:
           The `dict` keys as `list[str]`, corresponding to the possible fields of the card.
         '''
-        return list(self.__dict__.keys())
+        return list(Card._FIELD_NAMES)
 
     def rarity_names(self) -> list[str]:
         '''
@@ -368,7 +759,9 @@ class Card:
         Returns:
           A `list` of card rarity names associated with the card.
         '''
-        return [RARITIES[r] for r in self.rarities]
+        if self._rarity_idx is None:
+            return [RARITIES[r] for r in self.rarities]
+        return [RARITY_NAMES[i] for i in self._rarity_idx]
 
     def render(self, heading_level: str = '###', icon_size: int = 11) -> Any:
         '''
@@ -381,28 +774,18 @@ class Card:
         Returns:
           The IPython-rendered markdown output.
         '''
-        mdstr = f'{heading_level} {self.name} _({self.type_text})_\n\n'
+        parts = [f'{heading_level} {self.name} _({self.type_text})_\n\n']
         if not self.body is None:
-            with_images = self.body
-            for k, v in ICON_CODE_IMAGE_URLS.items():
-                with_images = with_images.replace(k, f'<img src="{v}" alt="{k}" width="{icon_size}"/>')
-            mdstr += f'{with_images}\n\n'
+            parts.append(f'{_render_icons(self.body, icon_size)}\n\n')
         if not self.flavor_text is None:
-            mdstr += f'{self.flavor_text}\n\n'
-        mdstr += '| Attribute | Value |\n|---|---|\n'
-        if not self.power is None:
-            mdstr += f'| Attack Power | {self.power} |\n'
-        if not self.defense is None:
-            mdstr += f'| Defense | {self.defense} |\n'
-        if not self.health is None:
-            mdstr += f'| Health | {self.health} |\n'
-        if not self.intelligence is None:
-            mdstr += f'| Intelligence | {self.intelligence} |\n'
-        if not self.pitch is None:
-            mdstr += f'| Pitch Value | {self.pitch} |\n'
-        if not self.cost is None:
-            mdstr += f'| Resource Cost | {self.cost} |\n'
-        return display(Markdown(mdstr))
+            parts.append(f'{self.flavor_text}\n\n')
+        parts.append('| Attribute | Value |\n|---|---|\n')
+        for label, field in RENDER_ATTRIBUTES:
+            value = getattr(self, field)
+            if not value is None:
+                parts.append(f'| {label} | {value} |\n')
+        from IPython.display import display, Markdown
+        return display(Markdown(''.join(parts)))
 
     def render_body(self, icon_size: int = 11) -> Any:
         '''
@@ -415,10 +798,8 @@ class Card:
           The IPython-rendered markdown output.
         '''
         if self.body is None: return 'Specified card does not have any body text.'
-        with_images = self.body
-        for k, v in ICON_CODE_IMAGE_URLS.items():
-            with_images = with_images.replace(k, f'<img src="{v}" alt="{k}" width="{icon_size}"/>')
-        return display(Markdown(with_images))
+        from IPython.display import display, Markdown
+        return display(Markdown(_render_icons(self.body, icon_size)))
 
     def tcgplayer_url(self) -> str:
         '''
@@ -436,7 +817,11 @@ class Card:
         Returns:
           A copy of the raw `dict` representation of the card.
         '''
-        return copy.deepcopy(self.__dict__)
+        rep = {}
+        for k in Card._FIELD_NAMES:
+            v = getattr(self, k)
+            rep[k] = v.copy() if k in STRING_LIST_FIELDS or k == 'legality' else v
+        return rep
 
     def to_json(self) -> str:
         '''
@@ -445,7 +830,20 @@ class Card:
         Returns:
           A JSON string representation of the card.
         '''
-        return json.dumps(self.__dict__, indent=JSON_INDENT)
+        return json.dumps(self._to_json_dict(), indent=JSON_INDENT)
+
+    def _to_json_dict(self) -> dict[str, Any]:
+        '''
+        Returns the raw python dictionary to serialize this card from.
+
+        Note:
+          Unlike `to_dict()`, the values of the resulting `dict` are not
+          copies, so it should not be modified.
+
+        Returns:
+          A `dict` referencing the fields of the card.
+        '''
+        return {k: getattr(self, k) for k in Card._FIELD_NAMES}
 
     def to_series(self) -> Series:
         '''
@@ -457,6 +855,8 @@ class Card:
         '''
         return Series(self.to_dict())
 
+Card._FIELD_NAMES = tuple(f.name for f in dataclasses.fields(Card))
+
 
 class CardList(UserList):
     '''
@@ -466,11 +866,71 @@ class CardList(UserList):
       This is ultimately a superclass of `list`, and thus supports all common
       `list` methods.
 
+    Note:
+      Some per-card values (such as the types of each card) are cached on the
+      list as columnar arrays the first time they are needed. These caches are
+      discarded whenever the list is modified through its `list` methods, but
+      not when `data` is modified directly.
+
     Attributes:
       data: The raw `list` of `Card` objects contained within the object.
     '''
     data: list[Card]
 
+    def __init__(self, initlist: Optional[Iterable[Card]] = None):
+        '''
+        Creates a new list of cards.
+
+        Args:
+          initlist: An optional iterable of cards to initialize the list with.
+        '''
+        super().__init__(initlist)
+        self._cache: dict[str, Any] = {}
+
+    def __contains__(self, item: Any) -> bool:
+        '''
+        Returns whether the specified card is in this list, using a (cached)
+        set of the cards in the list rather than scanning it.
+
+        Args:
+          item: The card to look for.
+
+        Returns:
+          Whether the card is in the list.
+        '''
+        if not isinstance(item, Card): return item in self.data
+        return item in self._memoize('members', lambda: frozenset(self.data))
+
+    def __delitem__(self, i: Any) -> None:
+        super().__delitem__(i)
+        self._invalidate()
+
+    def __getstate__(self) -> dict[str, Any]:
+        '''
+        Returns the state of the list used when copying or pickling, excluding
+        any cached values.
+
+        Returns:
+          The state of the list.
+        '''
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+        return state
+
+    def __iadd__(self, other: Iterable[Card]) -> CardList:
+        res = super().__iadd__(other)
+        self._invalidate()
+        return res
+
+    def __imul__(self, n: int) -> CardList:
+        res = super().__imul__(n)
+        self._invalidate()
+        return res
+
+    def __setitem__(self, i: Any, item: Any) -> None:
+        super().__setitem__(i, item)
+        self._invalidate()
+
     def actions(self) -> CardList:
         '''
         Returns the set of all action cards in this card list.
@@ -478,7 +938,11 @@ class CardList(UserList):
         Returns:
           The set of all action cards in the card list.
         '''
-        return CardList([card for card in self.data if card.is_action()])
+        return self._select_types(TYPE_BITS['Action'])
+
+    def append(self, item: Card) -> None:
+        super().append(item)
+        self._invalidate()
 
     def attacks(self) -> CardList:
         '''
@@ -487,7 +951,7 @@ class CardList(UserList):
         Returns:
           The set of all attack cards in the card list.
         '''
-        return CardList([card for card in self.data if card.is_attack()])
+        return self._select_types(TYPE_BITS['Attack'])
 
     def attack_reactions(self) -> CardList:
         '''
@@ -496,7 +960,7 @@ class CardList(UserList):
         Returns:
           The set of all attack reaction cards in the card list.
         '''
-        return CardList([card for card in self.data if card.is_attack_reaction()])
+        return self._select_types(TYPE_BITS['Attack Reaction'])
 
     def auras(self) -> CardList:
         '''
@@ -505,7 +969,11 @@ class CardList(UserList):
         Returns:
           The set of all aura cards in the card list.
         '''
-        return CardList([card for card in self.data if card.is_aura()])
+        return self._select_types(TYPE_BITS['Aura'])
+
+    def clear(self) -> None:
+        super().clear()
+        self._invalidate()
 
     def costs(self) -> list[int]:
         '''
@@ -517,10 +985,9 @@ class CardList(UserList):
         Returns:
           The set of all card costs in the card list.
         '''
-        res = []
-        for card in self.data:
-            if isinstance(card.cost, int): res.append(card.cost)
-        return sorted(list(set(res)))
+        def compute() -> list[int]:
+            return np.unique(self._valid_values('cost')).tolist()
+        return list(self._memoize('keys:costs', compute))
 
     def counts(self) -> dict[str, int]:
         '''
@@ -530,13 +997,7 @@ class CardList(UserList):
         Returns:
           A `dict` of card counts by full name.
         '''
-        counts = {}
-        for card in self.data:
-            if card.full_name in counts:
-                counts[card.full_name] += 1
-            else:
-                counts[card.full_name] = 1
-        return counts
+        return dict(Counter(map(operator.attrgetter('full_name'), self.data)))
 
     def defense_reactions(self) -> CardList:
         '''
@@ -545,7 +1006,7 @@ class CardList(UserList):
         Returns:
           The set of all defense reaction cards in the card list.
         '''
-        return CardList([card for card in self.data if card.is_defense_reaction()])
+        return self._select_types(TYPE_BITS['Defense Reaction'])
 
     def defense_values(self) -> list[int]:
         '''
@@ -558,10 +1019,9 @@ class CardList(UserList):
         Returns:
           A unique `list` of card defense values associated with the list of cards.
         '''
-        res = []
-        for card in self.data:
-            if isinstance(card.defense, int): res.append(card.defense)
-        return sorted(list(set(res)))
+        def compute() -> list[int]:
+            return np.unique(self._valid_values('defense')).tolist()
+        return list(self._memoize('keys:defense_values', compute))
 
     def draw(self, num: int, order: int = -1, remove: bool = False) -> CardList:
         '''
@@ -587,26 +1047,31 @@ class CardList(UserList):
         if num <= 0:
             raise Exception('specified number of cards must be a positive integer')
         res = []
+        if order in (-1, 1) and remove and num > len(self.data):
+            raise IndexError('pop from empty list')
         if order == -1:
             if remove:
-                for _ in range(0, num):
-                    res.append(self.pop())
+                res = self.data[:-num-1:-1]
+                del self.data[-num:]
+                self._invalidate()
             else:
-                res = self.data[-num:]
+                return self._subset(slice(-num, None))
         elif order == 0:
             if remove:
-                for _ in range(0, num):
-                    res.append(self.pop(random.randrange(len(self.data))))
+                drawn = random.sample(range(len(self.data)), num)
+                res = [self.data[i] for i in drawn]
+                drawn = set(drawn)
+                self.data[:] = [c for i, c in enumerate(self.data) if not i in drawn]
+                self._invalidate()
             else:
-                potential = [c for c in self.data]
-                for _ in range(0, num):
-                    res.append(potential.pop(random.randrange(len(potential))))
+                return self._subset(random.sample(range(len(self.data)), num))
         elif order == 1:
             if remove:
-                for _ in range(0, num):
-                    res.append(self.pop(0))
+                res = self.data[:num]
+                del self.data[:num]
+                self._invalidate()
             else:
-                res = self.data[num:]
+                return self._subset(slice(num, None))
         else:
             raise Exception('specified "order" must be -1, 0, or 1')
         return CardList(res)
@@ -628,12 +1093,17 @@ class CardList(UserList):
         Returns:
           The set of all equipment cards in the card list.
         '''
-        return CardList([card for card in self.data if card.is_equipment()])
+        return self._select_types(TYPE_BITS['Equipment'])
+
+    def extend(self, other: Iterable[Card]) -> None:
+        super().extend(other)
+        self._invalidate()
 
     def filter(
             self,
             body: Optional[Any] = None,
             cost: Optional[Any] = None,
+            deep: bool = False,
             defense: Optional[Any] = None,
             full_name: Optional[Any] = None,
             grants: Optional[Any] = None,
@@ -681,6 +1151,7 @@ class CardList(UserList):
         Args:
           body: A `str` or function to filter by `body`.
           cost: An `int`, `tuple[int, int]`, or function to filter by `cost`.
+          deep: Whether the resulting list should contain copies of the `Card` objects rather than the original objects.
           defense: An `int`, `tuple[int, int]`, or function to filter by `defense`.
           full_name: A `str` or function to filter by `full_name`.
           grants: A `str`, `list[str]`, or function to filter by `grants`.
@@ -699,272 +1170,124 @@ class CardList(UserList):
           types: A `str`, `list[str]`, or function to filter by `types`.
 
         Returns:
-          A new `CardList` containing copies of `Card` objects that meet the filtering requirements.
-        '''
-        if len(self.data) < 2: return copy.deepcopy(self)
-        filtered = []
-        for c in self:
-            if not body is None:
-                if isinstance(body, str):
-                    if negate:
-                        if body.lower() in str(c.body).lower(): continue
-                    else:
-                        if not body.lower() in str(c.body).lower(): continue
-                else:
-                    if negate:
-                        if body(c.body): continue
-                    else:
-                        if not body(c.body): continue
-            if not cost is None:
-                if isinstance(cost, int):
-                    if negate:
-                        if isinstance(c.cost, int) and cost == c.cost: continue
-                    else:
-                        if not isinstance(c.cost, int) or cost != c.cost: continue
-                elif isinstance(cost, tuple):
-                    if negate:
-                        if isinstance(c.cost, int) and c.cost >= cost[0] and c.cost <= cost[1]: continue
-                    else:
-                        if not isinstance(c.cost, int) or c.cost < cost[0] or c.cost > cost[1]: continue
-                else:
-                    if negate:
-                        if cost(c.cost): continue
-                    else:
-                        if not cost(c.cost): continue
-            if not defense is None:
-                if isinstance(defense, int):
-                    if negate:
-                        if isinstance(c.defense, int) and defense == c.defense: continue
-                    else:
-                        if not isinstance(c.defense, int) or defense != c.defense: continue
-                elif isinstance(defense, tuple):
-                    if negate:
-                        if isinstance(c.defense, int) and c.defense >= defense[0] and c.defense <= defense[1]: continue
-                    else:
-                        if not isinstance(c.defense, int) or c.defense < defense[0] or c.defense > defense[1]: continue
-                else:
-                    if negate:
-                        if defense(c.defense): continue
-                    else:
-                        if not defense(c.defense): continue
-            if not full_name is None:
-                if isinstance(full_name, str):
-                    if negate:
-                        if full_name.lower() in c.full_name.lower(): continue
-                    else:
-                        if not full_name.lower() in c.full_name.lower(): continue
-                else:
-                    if negate:
-                        if full_name(c.full_name): continue
-                    else:
-                        if not full_name(c.full_name): continue
-            if not grants is None:
-                if isinstance(grants, str):
-                    if negate:
-                        if grants in c.grants: continue
-                    else:
-                        if not grants in c.grants: continue
-                elif isinstance(grants, list):
-                    if negate:
-                        if True in [(x in c.grants) for x in grants]: continue
-                    else:
-                        if not (True in [(x in c.grants) for x in grants]): continue
-                else:
-                    if negate:
-                        if grants(c.grants): continue
-                    else:
-                        if not grants(c.grants): continue
-            if not health is None:
-                if isinstance(health, int):
-                    if negate:
-                        if isinstance(c.health, int) and health == c.health: continue
-                    else:
-                        if not isinstance(c.health, int) or health != c.health: continue
-                elif isinstance(health, tuple):
-                    if negate:
-                        if isinstance(c.health, int) and c.health >= health[0] and c.health <= health[1]: continue
-                    else:
-                        if not isinstance(c.health, int) or c.health < health[0] or c.health > health[1]: continue
-                else:
-                    if negate:
-                        if health(c.health): continue
-                    else:
-                        if not health(c.health): continue
-            if not intelligence is None:
-                if isinstance(intelligence, int):
-                    if negate:
-                        if isinstance(c.intelligence, int) and intelligence == c.intelligence: continue
-                    else:
-                        if not isinstance(c.intelligence, int) or intelligence != c.intelligence: continue
-                elif isinstance(intelligence, tuple):
-                    if negate:
-                        if isinstance(c.intelligence, int) and c.intelligence >= intelligence[0] and c.intelligence <= intelligence[1]: continue
-                    else:
-                        if not isinstance(c.intelligence, int) or c.intelligence < intelligence[0] or c.intelligence > intelligence[1]: continue
-                else:
-                    if negate:
-                        if intelligence(c.intelligence): continue
-                    else:
-                        if not intelligence(c.intelligence): continue
-            if not keywords is None:
-                if isinstance(keywords, str):
-                    if negate:
-                        if keywords in c.keywords: continue
-                    else:
-                        if not keywords in c.keywords: continue
-                elif isinstance(keywords, list):
-                    if negate:
-                        if True in [(x in c.keywords) for x in keywords]: continue
-                    else:
-                        if not (True in [(x in c.keywords) for x in keywords]): continue
-                else:
-                    if negate:
-                        if keywords(c.keywords): continue
-                    else:
-                        if not keywords(c.keywords): continue
-            if not legality is None:
-                if isinstance(legality, str):
-                    if negate:
-                        if c.legality[legality]: continue
-                    else:
-                        if not c.legality[legality]: continue
-                else:
-                    if negate:
-                        if legality(c.legality): continue
-                    else:
-                        if not legality(c.legality): continue
-            if not name is None:
-                if isinstance(name, str):
-                    if negate:
-                        if name.lower() in c.name.lower(): continue
-                    else:
-                        if not name.lower() in c.name.lower(): continue
-                else:
-                    if negate:
-                        if name(c.name): continue
-                    else:
-                        if not name(c.name): continue
-            if not pitch is None:
-                if isinstance(pitch, int):
-                    if negate:
-                        if isinstance(c.pitch, int) and pitch == c.pitch: continue
-                    else:
-                        if not isinstance(c.pitch, int) or pitch != c.pitch: continue
-                elif isinstance(pitch, str):
-                    pl = pitch.lower()
-                    if not pl in ['r', 'red', 'y', 'yellow', 'b', 'blue']:
-                        raise Exception(f'unknown pitch filter string "{pitch}"')
-                    if negate:
-                        if pl.startswith('b') and c.is_blue(): continue
-                        elif pl.startswith('r') and c.is_red(): continue
-                        elif pl.startswith('y') and c.is_yellow(): continue
-                    else:
-                        if pl.startswith('b') and not c.is_blue(): continue
-                        elif pl.startswith('r') and not c.is_red(): continue
-                        elif pl.startswith('y') and not c.is_yellow(): continue
-                elif isinstance(pitch, tuple):
-                    if negate:
-                        if isinstance(c.pitch, int) and c.pitch >= pitch[0] and c.pitch <= pitch[1]: continue
-                    else:
-                        if not isinstance(c.pitch, int) or c.pitch < pitch[0] or c.pitch > pitch[1]: continue
-                else:
-                    if negate:
-                        if pitch(c.pitch): continue
-                    else:
-                        if not pitch(c.pitch): continue
-            if not power is None:
-                if isinstance(power, int):
-                    if negate:
-                        if isinstance(c.power, int) and power == c.power: continue
-                    else:
-                        if not isinstance(c.power, int) or power != c.power: continue
-                elif isinstance(power, tuple):
-                    if negate:
-                        if isinstance(c.power, int) and c.power >= power[0] and c.power <= power[1]: continue
-                    else:
-                        if not isinstance(c.power, int) or c.power < power[0] or c.power > power[1]: continue
-                else:
-                    if negate:
-                        if power(c.power): continue
-                    else:
-                        if not power(c.power): continue
-            if not rarities is None:
-                if isinstance(rarities, str):
-                    if negate:
-                        if rarities in c.rarities: continue
-                    else:
-                        if not rarities in c.rarities: continue
-                elif isinstance(rarities, list):
-                    if negate:
-                        if True in [(x in c.rarities) for x in rarities]: continue
-                    else:
-                        if not (True in [(x in c.rarities) for x in rarities]): continue
-                else:
-                    if negate:
-                        if rarities(c.rarities): continue
-                    else:
-                        if not rarities(c.rarities): continue
-            if not sets is None:
-                if isinstance(sets, str):
-                    if negate:
-                        if sets in c.sets: continue
-                    else:
-                        if not sets in c.sets: continue
-                elif isinstance(sets, list):
-                    if negate:
-                        if True in [(x in c.sets) for x in sets]: continue
-                    else:
-                        if not (True in [(x in c.sets) for x in sets]): continue
-                else:
-                    if negate:
-                        if sets(c.sets): continue
-                    else:
-                        if not sets(c.sets): continue
-            if not tags is None:
-                if isinstance(tags, str):
-                    if negate:
-                        if tags in c.tags: continue
-                    else:
-                        if not tags in c.tags: continue
-                elif isinstance(tags, list):
-                    if negate:
-                        if True in [(x in c.tags) for x in tags]: continue
-                    else:
-                        if not (True in [(x in c.tags) for x in tags]): continue
-                else:
-                    if negate:
-                        if tags(c.tags): continue
-                    else:
-                        if not tags(c.tags): continue
-            if not type_text is None:
-                if isinstance(type_text, str):
-                    if negate:
-                        if type_text.lower() in c.type_text.lower(): continue
-                    else:
-                        if not type_text.lower() in c.type_text.lower(): continue
-                else:
-                    if negate:
-                        if type_text(c.type_text): continue
-                    else:
-                        if not type_text(c.type_text): continue
-            if not types is None:
-                if isinstance(types, str):
-                    if negate:
-                        if types in c.types: continue
-                    else:
-                        if not types in c.types: continue
-                elif isinstance(types, list):
-                    if negate:
-                        if True in [(x in c.types) for x in types]: continue
-                    else:
-                        if not (True in [(x in c.types) for x in types]): continue
-                else:
-                    if negate:
-                        if types(c.types): continue
-                    else:
-                        if not types(c.types): continue
-            filtered.append(copy.deepcopy(c))
-        return CardList(filtered)
+          A new `CardList` containing the `Card` objects that meet the filtering requirements.
+        '''
+        if len(self.data) < 2: return self._subset(slice(None), clone=deep)
+        # With no filters supplied every card is kept (even when negated), so
+        # skip building any masks or predicates.
+        if all(x is None for x in (body, cost, defense, full_name, grants, health, intelligence, keywords, legality, name, pitch, power, rarities, sets, tags, type_text, types)):
+            return self._subset(slice(None), clone=deep)
+        data = self.data
+        keep = np.ones(len(data), dtype=bool)
+        matches = np.empty(len(data), dtype=bool)
+        scratch = np.empty(len(data), dtype=bool)
+        for field, value in (('cost', cost), ('defense', defense), ('health', health), ('intelligence', intelligence), ('pitch', pitch), ('power', power)):
+            if value is None: continue
+            # Equality and range queries are both expressed as inclusive bounds,
+            # so every numeric field is checked by the same in-place comparisons
+            # without allocating temporary masks.
+            if isinstance(value, int):
+                lo = hi = value
+            elif isinstance(value, tuple):
+                lo, hi = value
+            elif field == 'pitch' and isinstance(value, str):
+                lo = hi = PITCH_COLORS.get(value.lower())
+                if lo is None:
+                    raise Exception(f'unknown pitch filter string "{value}"')
+            else:
+                continue
+            values, valid = self._value_column(field)
+            if lo == hi:
+                np.equal(values, lo, out=matches)
+            else:
+                np.greater_equal(values, lo, out=matches)
+                np.less_equal(values, hi, out=scratch)
+                matches &= scratch
+            matches &= valid
+            if negate: np.logical_not(matches, out=matches)
+            keep &= matches
+        for field, value in (('grants', grants), ('keywords', keywords), ('rarities', rarities), ('sets', sets), ('types', types)):
+            if isinstance(value, str):
+                value = [value]
+            elif not isinstance(value, list):
+                continue
+            index = self._list_index(field)
+            matches.fill(False)
+            for v in value:
+                if v in index: matches[index[v]] = True
+            if negate: np.logical_not(matches, out=matches)
+            keep &= matches
+        if isinstance(legality, str):
+            np.not_equal(self._legality_column(legality), negate, out=matches)
+            keep &= matches
+        # Each predicate is tagged with a rough estimate of its cost, so that
+        # cheap lookups (0) narrow down the rows before any callables (1) or
+        # substring searches (2) are evaluated.
+        preds = []
+        if not body is None:
+            if isinstance(body, str):
+                body_lower = body.lower()
+                preds.append((2, lambda c: body_lower in c._body_lower))
+            else:
+                preds.append((1, lambda c: body(c.body)))
+        if not cost is None and not isinstance(cost, (int, tuple)):
+            preds.append((1, lambda c: cost(c.cost)))
+        if not defense is None and not isinstance(defense, (int, tuple)):
+            preds.append((1, lambda c: defense(c.defense)))
+        if not full_name is None:
+            if isinstance(full_name, str):
+                full_name_lower = full_name.lower()
+                preds.append((2, lambda c: full_name_lower in c._full_name_lower))
+            else:
+                preds.append((1, lambda c: full_name(c.full_name)))
+        if not grants is None and not isinstance(grants, (str, list)):
+            preds.append((1, lambda c: grants(c.grants)))
+        if not health is None and not isinstance(health, (int, tuple)):
+            preds.append((1, lambda c: health(c.health)))
+        if not intelligence is None and not isinstance(intelligence, (int, tuple)):
+            preds.append((1, lambda c: intelligence(c.intelligence)))
+        if not keywords is None and not isinstance(keywords, (str, list)):
+            preds.append((1, lambda c: keywords(c.keywords)))
+        if not legality is None and not isinstance(legality, str):
+            preds.append((1, lambda c: legality(c.legality)))
+        if not name is None:
+            if isinstance(name, str):
+                name_lower = name.lower()
+                preds.append((2, lambda c: name_lower in c._name_lower))
+            else:
+                preds.append((1, lambda c: name(c.name)))
+        if not pitch is None and not isinstance(pitch, (int, str, tuple)):
+            preds.append((1, lambda c: pitch(c.pitch)))
+        if not power is None and not isinstance(power, (int, tuple)):
+            preds.append((1, lambda c: power(c.power)))
+        if not rarities is None and not isinstance(rarities, (str, list)):
+            preds.append((1, lambda c: rarities(c.rarities)))
+        if not sets is None and not isinstance(sets, (str, list)):
+            preds.append((1, lambda c: sets(c.sets)))
+        # Tags are user-defined and may be edited in place after a list is
+        # built, so they are checked per card rather than through a cached
+        # index that could go stale.
+        if not tags is None:
+            if isinstance(tags, str):
+                preds.append((0, lambda c: tags in c.tags))
+            elif isinstance(tags, list):
+                tags_set = frozenset(tags)
+                preds.append((0, lambda c: not tags_set.isdisjoint(c.tags)))
+            else:
+                preds.append((1, lambda c: tags(c.tags)))
+        if not type_text is None:
+            if isinstance(type_text, str):
+                type_text_lower = type_text.lower()
+                preds.append((2, lambda c: type_text_lower in c._type_text_lower))
+            else:
+                preds.append((1, lambda c: type_text(c.type_text)))
+        if not types is None and not isinstance(types, (str, list)):
+            preds.append((1, lambda c: types(c.types)))
+        if not preds: return self._subset(keep, clone=deep)
+        rows = np.flatnonzero(keep).tolist()
+        for _, pred in sorted(preds, key=lambda p: p[0]):
+            rows = [i for i in rows if bool(pred(data[i])) != negate]
+        return self._subset(rows, clone=deep)
 
     @staticmethod
     def from_csv(csvstr: str, delimiter: str = '\t') -> CardList:
@@ -973,84 +1296,73 @@ class CardList(UserList):
 
         Args:
           csvstr: The CSV string representation to parse.
-          delimiter: An alternative primary delimiter to pass to `csv.DictReader`.
+          delimiter: An alternative primary delimiter to pass to `csv.reader`.
 
         Returns:
           A new `CardList` object from the parsed data.
         '''
         try:
-            csv_data = csv.DictReader(io.StringIO(csvstr), delimiter = delimiter)
+            csv_data = csv.reader(io.StringIO(csvstr), delimiter = delimiter)
+            columns = {column: i for i, column in enumerate(next(csv_data, []))}
         except Exception as e:
             raise Exception(f'unable to parse CSV content - {e}')
-        def int_str_or_none(inputstr: str) -> int | str | None:
-            '''
-            A helper function for building out stuff like `cost`, etc.
-            '''
-            if not inputstr:
-                return None
-            elif inputstr.isdigit():
-                return int(inputstr)
-            else:
-                return inputstr
-        def image_url_parser(inputstr: str) -> list[str]:
-            '''
-            A helper function for parsing our the image URL list.
-            '''
-            if not inputstr: return []
-            result = []
-            if ',' in inputstr:
-                for substrings in [x.split(' - ', 1) for x in unidecode(inputstr).split(',') if ' - ' in x]:
-                    url = substrings[0].strip()
-                    result.append(url)
-            elif ' - ' in inputstr:
-                url = unidecode(inputstr).split(' - ', 1)[0].strip()
-                result.append(url)
-            return result
-        def legality_parser(csv_entry: dict[str, Any]) -> dict[str, bool]:
-            '''
-            A helper function for parsing card legality.
-            '''
-            res = {}
-            blitz_legal = not csv_entry['Blitz Legal'].lower() in ['no', 'false']
-            blitz_ll = True if csv_entry['Blitz Living Legend'] else False
-            blitz_banned = True if csv_entry['Blitz Banned'] else False
-            cc_legal = not csv_entry['CC Legal'].lower() in ['no', 'false']
-            cc_ll = True if csv_entry['CC Living Legend'] else False
-            cc_banned = True if csv_entry['CC Banned'] else False
-            commoner_legal = not csv_entry['Commoner Legal'].lower() in ['no', 'false']
-            commoner_banned = True if csv_entry['Commoner Banned'] else False
-            res['B'] = blitz_legal and not blitz_ll and not blitz_banned
-            res['CC'] = cc_legal and not cc_ll and not cc_banned
-            res['C'] = commoner_legal and not commoner_banned
-            res['UPF'] = res['CC']
-            return res
+        if not columns: return CardList([])
+        try:
+            i_ability_keywords = columns['Ability and Effect Keywords']
+            i_body = columns['Functional Text']
+            i_card_keywords = columns['Card Keywords']
+            i_cost = columns['Cost']
+            i_defense = columns['Defense']
+            i_flavor_text = columns['Flavor Text']
+            i_grants = columns['Granted Keywords']
+            i_health = columns['Health']
+            i_identifiers = columns['Identifiers']
+            i_image_urls = columns['Image URLs']
+            i_intelligence = columns['Intelligence']
+            i_legality = tuple(columns[column] for column in (
+                'Blitz Legal', 'Blitz Living Legend', 'Blitz Banned',
+                'CC Legal', 'CC Living Legend', 'CC Banned',
+                'Commoner Legal', 'Commoner Banned'
+            ))
+            i_name = columns['Name']
+            i_pitch = columns['Pitch']
+            i_power = columns['Power']
+            i_rarities = columns['Rarity']
+            i_sets = columns['Set Identifiers']
+            i_type_text = columns['Type Text']
+            i_types = columns['Types']
+        except KeyError as e:
+            raise Exception(f'unable to parse CSV content - missing column {e}')
         cards = []
-        for entry in csv_data:
+        for row in csv_data:
+            if not row: continue
             try:
+              name = unidecode(row[i_name].strip())
+              pitch = row[i_pitch]
               cards.append(Card(
-                  body         = unidecode(entry['Functional Text'].strip()) if entry['Functional Text'] else None,
-                  cost         = int_str_or_none(entry['Cost']),
-                  defense      = int_str_or_none(entry['Defense']),
-                  flavor_text  = unidecode(entry['Flavor Text'].strip()) if entry['Flavor Text'] else None,
-                  full_name    = unidecode(entry['Name'].strip()) + (f" ({entry['Pitch']})" if entry['Pitch'].isdigit() else ''),
-                  grants       = [x.strip() for x in entry['Granted Keywords'].split(',')] if entry['Granted Keywords'] else [],
-                  health       = int(entry['Health']) if entry['Health'].isdigit() else None,
-                  identifiers  = [x.strip() for x in entry['Identifiers'].split(',')],
-                  intelligence = int(entry['Intelligence']) if entry['Intelligence'].isdigit() else None,
-                  image_urls   = image_url_parser(entry['Image URLs']),
-                  keywords     = list(set(([x.strip() for x in entry['Card Keywords'].split(',')] if entry['Card Keywords'] else []) + ([x.strip() for x in entry['Ability and Effect Keywords'].split(',')] if entry['Ability and Effect Keywords'] else []))),
-                  legality     = legality_parser(entry),
-                  name         = unidecode(entry['Name'].strip()),
-                  pitch        = int(entry['Pitch']) if entry['Pitch'].isdigit() else None,
-                  power        = int_str_or_none(entry['Power']),
-                  rarities     = [x.strip() for x in entry['Rarity'].split(',')],
-                  sets         = [x.strip() for x in entry['Set Identifiers'].split(',')],
+                  body         = unidecode(row[i_body].strip()) if row[i_body] else None,
+                  cost         = _csv_int_str_or_none(row[i_cost]),
+                  defense      = _csv_int_str_or_none(row[i_defense]),
+                  flavor_text  = unidecode(row[i_flavor_text].strip()) if row[i_flavor_text] else None,
+                  full_name    = name + (f" ({pitch})" if pitch.isdigit() else ''),
+                  grants       = [sys.intern(x.strip()) for x in row[i_grants].split(',')] if row[i_grants] else [],
+                  health       = int(row[i_health]) if row[i_health].isdigit() else None,
+                  identifiers  = [x.strip() for x in row[i_identifiers].split(',')],
+                  intelligence = int(row[i_intelligence]) if row[i_intelligence].isdigit() else None,
+                  image_urls   = _csv_image_urls(row[i_image_urls]),
+                  keywords     = list({sys.intern(x.strip()) for x in itertools.chain(row[i_card_keywords].split(',') if row[i_card_keywords] else (), row[i_ability_keywords].split(',') if row[i_ability_keywords] else ())}),
+                  legality     = _csv_legality(row, i_legality),
+                  name         = name,
+                  pitch        = int(pitch) if pitch.isdigit() else None,
+                  power        = _csv_int_str_or_none(row[i_power]),
+                  rarities     = [sys.intern(x.strip()) for x in row[i_rarities].split(',')],
+                  sets         = [sys.intern(x.strip()) for x in row[i_sets].split(',')],
                   tags         = [],
-                  type_text    = unidecode(entry['Type Text'].strip()),
-                  types        = [x.strip() for x in entry['Types'].split(',')]
+                  type_text    = unidecode(row[i_type_text].strip()),
+                  types        = [sys.intern(x.strip()) for x in row[i_types].split(',')]
                ))
             except Exception as e:
-                raise Exception(f'unable to parse intermediate card data - {e} - {entry}')
+                raise Exception(f'unable to parse intermediate card data - {e} - {row}')
         return CardList(cards)
 
     @staticmethod
@@ -1066,9 +1378,26 @@ class CardList(UserList):
         '''
         cards = []
         for jcard in json.loads(jsonstr):
-            cards.append(Card(**jcard))
+            for field in INTERNED_FIELDS:
+                if field in jcard: jcard[field] = [sys.intern(x) for x in jcard[field]]
+            cards.append(Card.from_dict(jcard))
         return CardList(cards)
 
+    def _full_name_index(self) -> dict[str, Card]:
+        '''
+        Returns a (cached) mapping of the full names of the cards in this list
+        to the first card with that full name.
+
+        Returns:
+          A `dict` of cards by full name.
+        '''
+        if not 'full_name_index' in self._cache:
+            index = {}
+            for card in self.data:
+                index.setdefault(card.full_name, card)
+            self._cache['full_name_index'] = index
+        return self._cache['full_name_index']
+
     def full_names(self) -> list[str]:
         '''
         Returns the set of all full card names within this list of cards.
@@ -1076,7 +1405,7 @@ class CardList(UserList):
         Returns:
           A unique `list` of all full card names within the list of cards.
         '''
-        return sorted(list(set([card.full_name for card in self.data])))
+        return list(self._memoize('keys:full_names', lambda: sorted(self._full_name_index())))
 
     def grants(self) -> list[str]:
         '''
@@ -1085,10 +1414,7 @@ class CardList(UserList):
         Returns:
           A unique `list` of all card grant keywords within the list of cards.
         '''
-        res = []
-        for card in self.data:
-            res.extend(card.grants)
-        return sorted(list(set(res)))
+        return list(self._memoize('keys:grants', lambda: sorted(self._list_index('grants'))))
 
     def group(self, by: str = 'type_text') -> dict[int | str, CardList]:
         '''
@@ -1115,52 +1441,21 @@ class CardList(UserList):
           A `dict` of `CardList` objects grouped by the specified `Card` field.
         '''
         if len(self.data) < 1: return {}
-        res = {}
-        # str keys
-        if by == 'full_name':
-            for full_name in self.full_names():
-                res[full_name] = CardList([card for card in self if card.full_name == full_name]).sort()
-        elif by == 'grants':
-            for grants in self.grants():
-                res[grants] = CardList([card for card in self if grants in card.grants]).sort()
-        elif by in ['keyword', 'keywords']:
-            for keyword in self.keywords():
-                res[keyword] = CardList([card for card in self if keyword in card.keywords]).sort()
-        elif by == 'name':
-            for name in self.names():
-                res[name] = CardList([card for card in self if card.name == name]).sort()
-        elif by in ['rarity', 'rarities']:
-            for rarity in self.rarities():
-                res[rarity] = CardList([card for card in self if rarity in card.rarities]).sort()
-        elif by in ['set', 'sets']:
-            for card_set in self.sets():
-                res[card_set] = CardList([card for card in self if card_set in card.sets]).sort()
-        elif by in ['type', 'types']:
-            for type_val in self.types():
-                res[type_val] = CardList([card for card in self if type_val in card.types]).sort()
-        elif by == 'type_text':
-            for type_text in self.type_texts():
-                res[type_text] = CardList([card for card in self if card.type_text == type_text]).sort()
-        # int keys
-        elif by == 'cost':
-            for cost in self.costs():
-                res[cost] = CardList([card for card in self if isinstance(card.cost, int) and card.cost == cost]).sort()
-        elif by == 'defense':
-            for defense in self.defense_values():
-                res[defense] = CardList([card for card in self if isinstance(card.defense, int) and card.defense == defense]).sort()
-        elif by == 'health':
-            for health in self.health_values():
-                res[health] = CardList([card for card in self if isinstance(card.health, int) and card.health == health]).sort()
-        elif by == 'intelligence':
-            for intelligence in self.intelligence_values():
-                res[intelligence] = CardList([card for card in self if isinstance(card.intelligence, int) and card.intelligence == intelligence]).sort()
-        elif by == 'pitch':
-            for pitch in self.pitch_values():
-                res[pitch] = CardList([card for card in self if isinstance(card.pitch, int) and card.pitch == pitch]).sort()
-        elif by == 'power':
-            for power in self.power_values():
-                res[power] = CardList([card for card in self if isinstance(card.power, int) and card.power == power]).sort()
-        return res
+        field = GROUP_FIELDS.get(by)
+        if field is None: return {}
+        if field in STRING_LIST_FIELDS:
+            data = self.data
+            index = self._list_index(field)
+            return {key: CardList([data[i] for i in index[key].tolist()]).sort() for key in sorted(index)}
+        buckets = defaultdict(list)
+        if field in VALUE_FIELDS:
+            values, valid = self._value_column(field)
+            for card, value, is_int in zip(self.data, values.tolist(), valid.tolist()):
+                if is_int: buckets[value].append(card)
+        else:
+            for card, value in zip(self.data, map(operator.attrgetter(field), self.data)):
+                buckets[value].append(card)
+        return {key: CardList(buckets[key]).sort() for key in sorted(buckets)}
 
     def health_values(self) -> list[int]:
         '''
@@ -1173,13 +1468,12 @@ class CardList(UserList):
         Returns:
           The unique `list` of all card health values within the card list.
         '''
-        res = []
-        for card in self.data:
-            if isinstance(card.health, int): res.append(card.health)
-        return sorted(list(set(res)))
+        def compute() -> list[int]:
+            return np.unique(self._valid_values('health')).tolist()
+        return list(self._memoize('keys:health_values', compute))
 
     @staticmethod
-    def _hero_filter_related(hero: Card, cards: CardList, catalog: Optional[CardList] = None, include_generic: bool = True) -> CardList:
+    def _hero_filter_related(hero: Card, cards: CardList, catalog: Optional[CardList] = None, deep: bool = False, include_generic: bool = True) -> CardList:
         '''
         A helper function for filtering cards based on a hero. Do not call this
         function directly, instead use `Deck.filter_related`.
@@ -1192,6 +1486,7 @@ class CardList(UserList):
           hero: The hero card to filter with.
           cards: The collection of cards to filter.
           catalog: A catalog of cards representing all cards in the game.
+          deep: Whether the result should contain copies of the `Card` objects rather than the original objects.
           include_generic: Whether to include _Generic_ cards in the result.
 
         Returns:
@@ -1201,22 +1496,15 @@ class CardList(UserList):
         if _catalog is None:
             raise Exception('specified card catalog (or default card catalog) has not been initialized')
         if 'Shapeshifter' in hero.types: return cards
-        other_hero_types = _catalog.filter(types='Hero').filter(full_name=hero.name, negate=True).types()
-        relevant = [t for t in other_hero_types if not t in hero.types]
-        filtered = cards.filter(
-            types = [t for t in hero.types if not t in ['Hero', 'Young']] + (['Generic'] if include_generic else [])
-        ).filter(
-            types = lambda card_types: not any(t in relevant for t in card_types)
-        )
-        final = []
-        for card in filtered.data:
-            if any('Specialization' in k for k in card.keywords):
-                spec = next(k for k in card.keywords if 'Specialization' in k).replace('Specialization', '').strip()
-                if spec.lower() in hero.full_name.lower():
-                    final.append(card)
-            else:
-                final.append(card)
-        return CardList(copy.deepcopy(final))
+        relevant = _catalog._other_hero_types(hero).difference(hero.types)
+        hero_types = frozenset(t for t in hero.types if not t in ['Hero', 'Young']).union(['Generic'] if include_generic else [])
+        hero_full_name_lower = hero._full_name_lower
+        final = [
+            card for card in cards.data
+            if not hero_types.isdisjoint(card.types) and relevant.isdisjoint(card.types)
+            and (card._specialization is None or card._specialization in hero_full_name_lower)
+        ]
+        return CardList([card._clone() for card in final] if deep else final)
 
     def heroes(self) -> CardList:
         '''
@@ -1225,7 +1513,23 @@ class CardList(UserList):
         Returns:
           The set of all hero cards within the card list.
         '''
-        return CardList([card for card in self.data if card.is_hero()])
+        return self._select_types(TYPE_BITS['Hero'])
+
+    def _identifier_index(self) -> dict[str, Card]:
+        '''
+        Returns a (cached) mapping of the card identifiers in this list to the
+        first card with that identifier.
+
+        Returns:
+          A `dict` of cards by identifier.
+        '''
+        if not 'identifier_index' in self._cache:
+            index = {}
+            for card in self.data:
+                for identifier in card.identifiers:
+                    index.setdefault(identifier, card)
+            self._cache['identifier_index'] = index
+        return self._cache['identifier_index']
 
     def identifiers(self) -> list[str]:
         '''
@@ -1234,10 +1538,11 @@ class CardList(UserList):
         Returns:
           The unique `list` of all card identifiers within the card list.
         '''
-        res = []
-        for card in self.data:
-            res.extend(card.identifiers)
-        return sorted(list(set(res)))
+        return list(self._memoize('keys:identifiers', lambda: sorted(self._list_index('identifiers'))))
+
+    def insert(self, i: int, item: Card) -> None:
+        super().insert(i, item)
+        self._invalidate()
 
     def instants(self) -> CardList:
         '''
@@ -1246,7 +1551,7 @@ class CardList(UserList):
         Returns:
           The set of all instant cards within the card list.
         '''
-        return CardList([card for card in self.data if card.is_instant()])
+        return self._select_types(TYPE_BITS['Instant'])
 
     def intelligence_values(self) -> list[int]:
         '''
@@ -1260,10 +1565,19 @@ class CardList(UserList):
         Returns:
           A unique `list` of all card intelligence values within the list of cards.
         '''
-        res = []
-        for card in self.data:
-            if isinstance(card.intelligence, int): res.append(card.intelligence)
-        return sorted(list(set(res)))
+        def compute() -> list[int]:
+            return np.unique(self._valid_values('intelligence')).tolist()
+        return list(self._memoize('keys:intelligence_values', compute))
+
+    def _invalidate(self) -> None:
+        '''
+        Discards any values cached on this list of cards.
+
+        Note:
+          The cache is replaced rather than cleared, as shallow copies of the
+          list initially share the same cache object.
+        '''
+        self._cache = {}
 
     def item_cards(self) -> CardList:
         '''
@@ -1272,7 +1586,7 @@ class CardList(UserList):
         Returns:
           The set of all item cards within the list of cards.
         '''
-        return CardList([card for card in self.data if card.is_item()])
+        return self._select_types(TYPE_BITS['Item'])
 
     def keywords(self) -> list[str]:
         '''
@@ -1281,10 +1595,7 @@ class CardList(UserList):
         Returns:
           A unique `list` of all keywords within the list of cards.
         '''
-        res = []
-        for card in self.data:
-            res.extend(card.keywords)
-        return sorted(list(set(res)))
+        return list(self._memoize('keys:keywords', lambda: sorted(self._list_index('keywords'))))
 
     def legality(self) -> dict[str, bool]:
         '''
@@ -1299,9 +1610,58 @@ class CardList(UserList):
         '''
         res = {}
         for f in GAME_FORMATS.keys():
-            res[f] = not (False in [card.is_legal(f) for card in self.data])
+            res[f] = all(card.is_legal(f) for card in self.data)
         return res
 
+    def _legality_column(self, format: str) -> np.ndarray:
+        '''
+        Returns the (cached) legal status of each card in this list for the
+        specified format.
+
+        Note:
+          As with `Card.is_legal()`, cards are considered legal in any format
+          missing from their `legality` field.
+
+        Args:
+          format: The code of the game format (see `meta.GAME_FORMATS`).
+
+        Returns:
+          A `bool` array aligned with `data`.
+        '''
+        key = 'legal:' + format
+        if not key in self._cache:
+            self._cache[key] = np.fromiter(
+                (card.legality.get(format, True) for card in self.data),
+                dtype = bool,
+                count = len(self.data)
+            )
+        return self._cache[key]
+
+    def _list_index(self, field: str) -> dict[str, np.ndarray]:
+        '''
+        Returns a (cached) inverted index of the specified list field of the
+        cards in this list.
+
+        Note:
+          The index is not rebuilt when a card is modified in place, so it
+          should not be used for user-defined fields such as `tags`.
+
+        Args:
+          field: The `list[str]` `Card` field to index (see `STRING_LIST_FIELDS`).
+
+        Returns:
+          A `dict` mapping each value of the field to the (ascending) indices of the cards containing it.
+        '''
+        key = 'index:' + field
+        if not key in self._cache:
+            index = {}
+            for i, card in enumerate(self.data):
+                for value in getattr(card, field):
+                    rows = index.setdefault(value, [])
+                    if not rows or rows[-1] != i: rows.append(i)
+            self._cache[key] = {value: np.array(rows, dtype=np.intp) for value, rows in index.items()}
+        return self._cache[key]
+
     @staticmethod
     def load(file_path: str, set_catalog: bool = False) -> CardList:
         '''
@@ -1309,7 +1669,8 @@ class CardList(UserList):
 
         Note:
           If `set_catalog` is set to `True`, then a copy of the loaded card list
-          will also be set as the default `card.CARD_CATALOG`.
+          will also be set as the default `card.CARD_CATALOG`. This copy shares
+          its (read-only) `Card` objects with the returned list.
 
         Args:
           file_path: The file path to load from.
@@ -1327,7 +1688,7 @@ class CardList(UserList):
                 raise Exception('specified file is not a CSV or JSON file')
         if set_catalog:
             global CARD_CATALOG
-            CARD_CATALOG = copy.deepcopy(res)
+            CARD_CATALOG = CardList(res)
         return res
 
     def max_cost(self) -> int:
@@ -1340,12 +1701,9 @@ class CardList(UserList):
         Returns:
           The maximum card cost within the list of cards.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.cost for x in self.data if isinstance(x.cost, int)]
-        if array:
-            return max(array)
-        else:
-            return 0
+        values = self._valid_values('cost')
+        if not values.size: return 0
+        return int(values.max())
 
     def max_defense(self) -> int:
         '''
@@ -1357,12 +1715,9 @@ class CardList(UserList):
         Returns:
           The maximum card defense value within the list of cards.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.defense for x in self.data if isinstance(x.defense, int)]
-        if array:
-            return max(array)
-        else:
-            return 0
+        values = self._valid_values('defense')
+        if not values.size: return 0
+        return int(values.max())
 
     def max_health(self) -> int:
         '''
@@ -1374,12 +1729,9 @@ class CardList(UserList):
         Returns:
           The maximum card health value within the list of cards.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.health for x in self.data if isinstance(x.health, int)]
-        if array:
-            return max(array)
-        else:
-            return 0
+        values = self._valid_values('health')
+        if not values.size: return 0
+        return int(values.max())
 
     def max_intelligence(self) -> int:
         '''
@@ -1391,12 +1743,9 @@ class CardList(UserList):
         Returns:
           The maximum card intelligence value within the list of cards.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.intelligence for x in self.data if isinstance(x.intelligence, int)]
-        if array:
-            return max(array)
-        else:
-            return 0
+        values = self._valid_values('intelligence')
+        if not values.size: return 0
+        return int(values.max())
 
     def max_pitch(self) -> int:
         '''
@@ -1408,12 +1757,9 @@ class CardList(UserList):
         Returns:
           The maximum card pitch value within this list of cards.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.pitch for x in self.data if isinstance(x.pitch, int)]
-        if array:
-            return max(array)
-        else:
-            return 0
+        values = self._valid_values('pitch')
+        if not values.size: return 0
+        return int(values.max())
 
     def max_power(self) -> int:
         '''
@@ -1425,12 +1771,9 @@ class CardList(UserList):
         Returns:
           The maximum card power value within this list of cards.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.power for x in self.data if isinstance(x.power, int)]
-        if array:
-            return max(array)
-        else:
-            return 0
+        values = self._valid_values('power')
+        if not values.size: return 0
+        return int(values.max())
 
     def mean_cost(self, precision: int = 2) -> float:
         '''
@@ -1445,12 +1788,9 @@ class CardList(UserList):
         Returns:
           The mean card cost of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.cost for x in self.data if isinstance(x.cost, int)]
-        if array:
-            return round(mean(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('cost')
+        if not values.size: return 0.0
+        return round(float(values.mean()), precision)
 
     def mean_defense(self, precision: int = 2) -> float:
         '''
@@ -1465,12 +1805,9 @@ class CardList(UserList):
         Returns:
           The mean defense of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.defense for x in self.data if isinstance(x.defense, int)]
-        if array:
-            return round(mean(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('defense')
+        if not values.size: return 0.0
+        return round(float(values.mean()), precision)
 
     def mean_health(self, precision: int = 2) -> float:
         '''
@@ -1485,12 +1822,9 @@ class CardList(UserList):
         Returns:
           The mean health of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.health for x in self.data if isinstance(x.health, int)]
-        if array:
-            return round(mean(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('health')
+        if not values.size: return 0.0
+        return round(float(values.mean()), precision)
 
     def mean_intelligence(self, precision: int = 2) -> float:
         '''
@@ -1505,12 +1839,9 @@ class CardList(UserList):
         Returns:
           The mean intelligence of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.intelligence for x in self.data if isinstance(x.intelligence, int)]
-        if array:
-            return round(mean(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('intelligence')
+        if not values.size: return 0.0
+        return round(float(values.mean()), precision)
 
     def mean_pitch(self, precision: int = 2) -> float:
         '''
@@ -1525,12 +1856,9 @@ class CardList(UserList):
         Returns:
           The mean pitch value of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.pitch for x in self.data if isinstance(x.pitch, int)]
-        if array:
-            return round(mean(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('pitch')
+        if not values.size: return 0.0
+        return round(float(values.mean()), precision)
 
     def mean_power(self, precision: int = 2) -> float:
         '''
@@ -1545,12 +1873,9 @@ class CardList(UserList):
         Returns:
           The mean power of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.power for x in self.data if isinstance(x.power, int)]
-        if array:
-            return round(mean(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('power')
+        if not values.size: return 0.0
+        return round(float(values.mean()), precision)
 
     def median_cost(self, precision: int = 2) -> float:
         '''
@@ -1565,12 +1890,9 @@ class CardList(UserList):
         Returns:
           The median resource cost of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.cost for x in self.data if isinstance(x.cost, int)]
-        if array:
-            return round(median(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('cost')
+        if not values.size: return 0.0
+        return round(float(np.median(values)), precision)
 
     def median_defense(self, precision: int = 2) -> float:
         '''
@@ -1585,12 +1907,9 @@ class CardList(UserList):
         Returns:
           The median defense value of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.defense for x in self.data if isinstance(x.defense, int)]
-        if array:
-            return round(median(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('defense')
+        if not values.size: return 0.0
+        return round(float(np.median(values)), precision)
 
     def median_health(self, precision: int = 2) -> float:
         '''
@@ -1605,12 +1924,9 @@ class CardList(UserList):
         Returns:
           The median health of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.health for x in self if isinstance(x.health, int)]
-        if array:
-            return round(median(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('health')
+        if not values.size: return 0.0
+        return round(float(np.median(values)), precision)
 
     def median_intelligence(self, precision: int = 2) -> float:
         '''
@@ -1625,12 +1941,9 @@ class CardList(UserList):
         Returns:
           The median intelligence of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.intelligence for x in self.data if isinstance(x.intelligence, int)]
-        if array:
-            return round(median(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('intelligence')
+        if not values.size: return 0.0
+        return round(float(np.median(values)), precision)
 
     def median_pitch(self, precision: int = 2) -> float:
         '''
@@ -1645,12 +1958,9 @@ class CardList(UserList):
         Returns:
           The median pitch vlaue of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.pitch for x in self.data if isinstance(x.pitch, int)]
-        if array:
-            return round(median(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('pitch')
+        if not values.size: return 0.0
+        return round(float(np.median(values)), precision)
 
     def median_power(self, precision: int = 2) -> float:
         '''
@@ -1665,12 +1975,29 @@ class CardList(UserList):
         Returns:
           The median attack power of cards in the list.
         '''
-        if len(self.data) < 1: return 0.0
-        array = [x.power for x in self.data if isinstance(x.power, int)]
-        if array:
-            return round(median(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('power')
+        if not values.size: return 0.0
+        return round(float(np.median(values)), precision)
+
+    def _memoize(self, key: str, compute: Callable[[], Any]) -> Any:
+        '''
+        Returns the cached result associated with the specified key, computing
+        (and caching) it first if necessary.
+
+        Note:
+          The cache is cleared whenever the list is modified, so callers
+          returning mutable cached results should return copies of them.
+
+        Args:
+          key: The key of the cached result.
+          compute: A function computing the result.
+
+        Returns:
+          The cached result.
+        '''
+        if not key in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
 
     @staticmethod
     def merge(*args: CardList, unique: bool = False) -> CardList:
@@ -1685,12 +2012,15 @@ class CardList(UserList):
           The merged collection of cards.
         '''
         merged = []
+        seen = set()
         for card_list in args:
             if card_list is None: continue
+            if not unique:
+                merged.extend(card_list)
+                continue
             for card in card_list:
-                if unique and not card in merged:
-                    merged.append(card)
-                elif not unique:
+                if not card in seen:
+                    seen.add(card)
                     merged.append(card)
         return CardList(merged)
 
@@ -1704,12 +2034,9 @@ class CardList(UserList):
         Returns:
           The minimum card cost within the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.cost for x in self.data if isinstance(x.cost, int)]
-        if array:
-            return min(array)
-        else:
-            return 0
+        values = self._valid_values('cost')
+        if not values.size: return 0
+        return int(values.min())
 
     def min_defense(self) -> int:
         '''
@@ -1721,12 +2048,9 @@ class CardList(UserList):
         Returns:
           The minimum card defense value within the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.defense for x in self.data if isinstance(x.defense, int)]
-        if array:
-            return min(array)
-        else:
-            return 0
+        values = self._valid_values('defense')
+        if not values.size: return 0
+        return int(values.min())
 
     def min_health(self) -> int:
         '''
@@ -1738,12 +2062,9 @@ class CardList(UserList):
         Returns:
           The minimum card health in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.health for x in self.data if isinstance(x.health, int)]
-        if array:
-            return min(array)
-        else:
-            return 0
+        values = self._valid_values('health')
+        if not values.size: return 0
+        return int(values.min())
 
     def min_intelligence(self) -> int:
         '''
@@ -1755,12 +2076,9 @@ class CardList(UserList):
         Returns:
           The minimum intelligence in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.intelligence for x in self.data if isinstance(x.intelligence, int)]
-        if array:
-            return min(array)
-        else:
-            return 0
+        values = self._valid_values('intelligence')
+        if not values.size: return 0
+        return int(values.min())
 
     def min_pitch(self) -> int:
         '''
@@ -1772,12 +2090,9 @@ class CardList(UserList):
         Returns:
           The minimum pitch value in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.pitch for x in self.data if isinstance(x.pitch, int)]
-        if array:
-            return min(array)
-        else:
-            return 0
+        values = self._valid_values('pitch')
+        if not values.size: return 0
+        return int(values.min())
 
     def min_power(self) -> int:
         '''
@@ -1789,12 +2104,9 @@ class CardList(UserList):
         Returns:
           The minimum attack power in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.power for x in self.data if isinstance(x.power, int)]
-        if array:
-            return min(array)
-        else:
-            return 0
+        values = self._valid_values('power')
+        if not values.size: return 0
+        return int(values.min())
 
     def names(self) -> list[str]:
         '''
@@ -1803,7 +2115,7 @@ class CardList(UserList):
         Returns:
           The unique `list` of card names within the list of cards.
         '''
-        return sorted(list(set([card.name for card in self.data])))
+        return list(self._memoize('keys:names', lambda: sorted(set(map(operator.attrgetter('name'), self.data)))))
 
     def num_blue(self) -> int:
         '''
@@ -1812,7 +2124,7 @@ class CardList(UserList):
         Returns:
           The number of cards in this card list that pitch for 3 resources.
         '''
-        return len(self.filter(pitch=3))
+        return self._pitch_counts()[3]
 
     def num_red(self) -> int:
         '''
@@ -1821,7 +2133,7 @@ class CardList(UserList):
         Returns:
           The number of cards in this card list that pitch for 1 resource.
         '''
-        return len(self.filter(pitch=1))
+        return self._pitch_counts()[1]
 
     def num_yellow(self) -> int:
         '''
@@ -1830,7 +2142,24 @@ class CardList(UserList):
         Returns:
           The number of cards in this card list that pitch for 2 resources.
         '''
-        return len(self.filter(pitch=2))
+        return self._pitch_counts()[2]
+
+    def _other_hero_types(self, hero: Card) -> frozenset[str]:
+        '''
+        Returns the (cached) set of types of the heroes in this list which are
+        not a version of the specified hero.
+
+        Args:
+          hero: The hero card to exclude the versions of.
+
+        Returns:
+          The `frozenset` of types of the other heroes in the list.
+        '''
+        def compute() -> frozenset[str]:
+            return frozenset(itertools.chain.from_iterable(
+                card.types for card in self.heroes().data if not hero._name_lower in card._full_name_lower
+            ))
+        return self._memoize('other_hero_types:' + hero._name_lower, compute)
 
     def pitch_cost_difference(self) -> int:
         '''
@@ -1849,6 +2178,18 @@ class CardList(UserList):
         '''
         return self.total_pitch() - self.total_cost()
 
+    def _pitch_counts(self) -> list[int]:
+        '''
+        Returns the (cached) number of cards in this list with each pitch value.
+
+        Returns:
+          A `list` whose `i`-th element is the number of cards which pitch for `i` resources.
+        '''
+        def compute() -> list[int]:
+            values, valid = self._value_column('pitch')
+            return np.bincount(values[valid & (values >= 0)], minlength=4).tolist()
+        return self._memoize('pitch_counts', compute)
+
     def pitch_values(self) -> list[int]:
         '''
         Returns the set of all card pitch values associated with this list of
@@ -1860,10 +2201,9 @@ class CardList(UserList):
         Returns:
           The unique `list` of card pitch values within the list of cards.
         '''
-        res = []
-        for card in self.data:
-            if isinstance(card.pitch, int): res.append(card.pitch)
-        return sorted(list(set(res)))
+        def compute() -> list[int]:
+            return np.unique(self._valid_values('pitch')).tolist()
+        return list(self._memoize('keys:pitch_values', compute))
 
     def power_defense_difference(self) -> int:
         '''
@@ -1882,6 +2222,11 @@ class CardList(UserList):
         '''
         return self.total_power() - self.total_defense()
 
+    def pop(self, i: int = -1) -> Card:
+        res = super().pop(i)
+        self._invalidate()
+        return res
+
     def power_values(self) -> list[int]:
         '''
         Returns the set of all card power values associated with this list of
@@ -1893,10 +2238,9 @@ class CardList(UserList):
         Returns:
           The unique `list` of power values within the list of cards.
         '''
-        res = []
-        for card in self.data:
-            if isinstance(card.power, int): res.append(card.power)
-        return sorted(list(set(res)))
+        def compute() -> list[int]:
+            return np.unique(self._valid_values('power')).tolist()
+        return list(self._memoize('keys:power_values', compute))
 
     def save(self, file_path: str):
         '''
@@ -1907,11 +2251,11 @@ class CardList(UserList):
         '''
         with open(os.path.expanduser(file_path), 'w') as f:
             if file_path.endswith('.json'):
-                f.write(self.to_json())
+                json.dump(self.data, f, default=json_default, indent=JSON_INDENT)
             else:
                 raise Exception('specified file path is not a JSON file')
 
-    def sort(self, key: Any = 'name', reverse: bool = False) -> CardList:
+    def sort(self, key: Any = 'name', reverse: bool = False, deep: bool = False) -> CardList:
         '''
         Sorts the list of cards, returning a new sorted collection.
 
@@ -1930,34 +2274,37 @@ class CardList(UserList):
         Args:
           key: The `Card` field to sort by.
           reverse: Whether to reverse the sort order.
+          deep: Whether the resulting list should contain copies of the `Card` objects rather than the original objects.
 
         Returns:
-          A new, sorted `CardList` object.
+          A new, sorted `CardList` object containing the original `Card` objects.
         '''
         if isinstance(key, str):
-            contains_none = []
-            to_sort = []
-            for card in self.data:
-                if card[key] is None:
-                    contains_none.append(copy.deepcopy(card))
-                elif isinstance(card[key], str) and key in ['cost', 'defense', 'health', 'intelligence', 'pitch', 'power']:
-                    contains_none.append(copy.deepcopy(card))
-                else:
-                    to_sort.append(copy.deepcopy(card))
+            if not key in Card._FIELD_NAMES: raise KeyError(key)
             if key in ['identifiers', 'sets']:
-                sorted_part = sorted(to_sort, key = lambda x: x[key][0], reverse = reverse)
+                sort_value = lambda v: v[0]
             elif key in ['grants', 'keywords', 'tags', 'types']:
-                sorted_part = sorted(to_sort, key = lambda x: len(x[key]), reverse = reverse)
+                sort_value = len
             elif key == 'rarities':
-                sorted_part = sorted(to_sort, key = lambda x: sorted(RARITY_VALUE[y] for y in x[key])[-1] if x[key] else -1, reverse = reverse)
+                sort_value = lambda v: max(RARITY_VALUE[y] for y in v) if v else -1
             else:
-                sorted_part = sorted(to_sort, key = lambda x: x[key], reverse = reverse)
-            if reverse:
-                return CardList(sorted_part + contains_none)
-            else:
-                return CardList(contains_none + sorted_part)
+                sort_value = None
+            # Each card's field is fetched (and its sort value computed) once,
+            # while partitioning off the cards with no usable value.
+            contains_none = []
+            keyed = []
+            for card in self.data:
+                value = getattr(card, key)
+                if value is None or (key in VALUE_FIELDS and isinstance(value, str)):
+                    contains_none.append(card)
+                else:
+                    keyed.append((value if sort_value is None else sort_value(value), card))
+            keyed.sort(key = lambda kv: kv[0], reverse = reverse)
+            sorted_part = [card for _, card in keyed]
+            res = sorted_part + contains_none if reverse else contains_none + sorted_part
         else:
-            return CardList(sorted(copy.deepcopy(self.data), key = key, reverse = reverse))
+            res = sorted(self.data, key = key, reverse = reverse)
+        return CardList([card._clone() for card in res] if deep else res)
 
     def rarities(self) -> list[str]:
         '''
@@ -1966,10 +2313,7 @@ class CardList(UserList):
         Returns:
           A unique `list` of card rarities in the list of cards.
         '''
-        res = []
-        for card in self.data:
-            res.extend(card.rarities)
-        return sorted(list(set(res)))
+        return list(self._memoize('keys:rarities', lambda: sorted(self._list_index('rarities'))))
 
     def reactions(self) -> CardList:
         '''
@@ -1979,7 +2323,28 @@ class CardList(UserList):
         Returns:
           A list of all attack and defense reaction cards within the card list.
         '''
-        return CardList([card for card in self.data if card.is_reaction()])
+        return self._select_types(TYPE_BITS['Attack Reaction'] | TYPE_BITS['Defense Reaction'])
+
+    def remove(self, item: Card) -> None:
+        super().remove(item)
+        self._invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._invalidate()
+
+    def _select_types(self, bits: int) -> CardList:
+        '''
+        Returns the cards in this list containing any of the types associated
+        with the specified bits (see `TYPE_BITS`).
+
+        Args:
+          bits: The bitwise OR of the `TYPE_BITS` values to select.
+
+        Returns:
+          A new `CardList` of the selected cards.
+        '''
+        return self._subset((self._type_bits() & bits) != 0)
 
     def sets(self) -> list[str]:
         '''
@@ -1988,16 +2353,30 @@ class CardList(UserList):
         Returns:
           A unique `list` of all card sets within the list of cards.
         '''
-        card_sets = []
-        for card in self.data:
-            card_sets.extend(card.sets)
-        return sorted(list(set(card_sets)))
+        return list(self._memoize('keys:sets', lambda: sorted(self._list_index('sets'))))
 
     def shuffle(self) -> None:
         '''
         Shuffles this list of cards in-place.
-        '''
-        random.shuffle(self.data)
+
+        Note:
+          Rather than discarding the cache, cached columns are permuted along
+          with the cards, and the (order-independent) key lists are kept.
+        '''
+        order = list(range(len(self.data)))
+        random.shuffle(order)
+        data = self.data
+        data[:] = [data[i] for i in order]
+        indices = np.asarray(order, dtype=np.intp)
+        cache = {}
+        for k, v in self._cache.items():
+            if isinstance(v, np.ndarray):
+                cache[k] = v[indices]
+            elif isinstance(v, tuple):
+                cache[k] = tuple(a[indices] for a in v)
+            elif k.startswith('keys:'):
+                cache[k] = v
+        self._cache = cache
 
     def statistics(self, precision: int = 2) -> dict[str, int | float]:
         '''
@@ -2017,6 +2396,7 @@ class CardList(UserList):
         Returns:
           A `dict` containing the results of various statistical functions.
         '''
+        self._value_columns()
         return {
             'count': len(self.data),
             'max_cost': self.max_cost(),
@@ -2075,12 +2455,9 @@ class CardList(UserList):
         Returns:
           The standard deviation of card cost in the list.
         '''
-        if len(self.data) < 2: return 0.0
-        array = [x.cost for x in self.data if isinstance(x.cost, int)]
-        if len(array) >= 2:
-            return round(stdev(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('cost')
+        if values.size < 2: return 0.0
+        return round(float(np.std(values, ddof=1)), precision)
 
     def stdev_defense(self, precision: int = 2) -> float:
         '''
@@ -2095,12 +2472,9 @@ class CardList(UserList):
         Returns:
           The standard deviation of card defense in the list.
         '''
-        if len(self.data) < 2: return 0.0
-        array = [x.defense for x in self.data if isinstance(x.defense, int)]
-        if len(array) >= 2:
-            return round(stdev(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('defense')
+        if values.size < 2: return 0.0
+        return round(float(np.std(values, ddof=1)), precision)
 
     def stdev_health(self, precision: int = 2) -> float:
         '''
@@ -2115,12 +2489,9 @@ class CardList(UserList):
         Returns:
           The standard deviation of health in the list.
         '''
-        if len(self.data) < 2: return 0.0
-        array = [x.health for x in self.data if isinstance(x.health, int)]
-        if len(array) >= 2:
-            return round(stdev(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('health')
+        if values.size < 2: return 0.0
+        return round(float(np.std(values, ddof=1)), precision)
 
     def stdev_intelligence(self, precision: int = 2) -> float:
         '''
@@ -2135,12 +2506,9 @@ class CardList(UserList):
         Returns:
           The standard deviation of intelligence in the list.
         '''
-        if len(self.data) < 2: return 0.0
-        array = [x.intelligence for x in self.data if isinstance(x.intelligence, int)]
-        if len(array) >= 2:
-            return round(stdev(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('intelligence')
+        if values.size < 2: return 0.0
+        return round(float(np.std(values, ddof=1)), precision)
 
     def stdev_pitch(self, precision: int = 2) -> float:
         '''
@@ -2155,12 +2523,9 @@ class CardList(UserList):
         Returns:
           The standard deviation of pitch value in the list.
         '''
-        if len(self.data) < 2: return 0.0
-        array = [x.pitch for x in self.data if isinstance(x.pitch, int)]
-        if len(array) >= 2:
-            return round(stdev(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('pitch')
+        if values.size < 2: return 0.0
+        return round(float(np.std(values, ddof=1)), precision)
 
     def stdev_power(self, precision: int = 2) -> float:
         '''
@@ -2175,12 +2540,9 @@ class CardList(UserList):
         Returns:
           The standard deviation of attack power in the list.
         '''
-        if len(self.data) < 2: return 0.0
-        array = [x.power for x in self.data if isinstance(x.power, int)]
-        if len(array) >= 2:
-            return round(stdev(array), precision)
-        else:
-            return 0.0
+        values = self._valid_values('power')
+        if values.size < 2: return 0.0
+        return round(float(np.std(values, ddof=1)), precision)
 
     def to_dataframe(self) -> DataFrame:
         '''
@@ -2189,7 +2551,11 @@ class CardList(UserList):
         Returns:
           A pandas `DataFrame` object representing the list of cards.
         '''
-        return DataFrame(self.data)
+        if not self.data: return DataFrame()
+        return DataFrame(
+            {f: list(map(operator.attrgetter(f), self.data)) for f in Card._FIELD_NAMES},
+            copy = False
+        )
 
     def to_json(self) -> str:
         '''
@@ -2198,7 +2564,7 @@ class CardList(UserList):
         Returns:
           A JSON string representation of the list of cards.
         '''
-        return json.dumps(self.to_list(), indent=JSON_INDENT)
+        return json.dumps(self.data, default=json_default, indent=JSON_INDENT)
 
     def to_list(self) -> list[dict[str, Any]]:
         '''
@@ -2217,7 +2583,7 @@ class CardList(UserList):
         Returns:
           The set of token cards in the list.
         '''
-        return CardList([card for card in self.data if card.is_token()])
+        return self._select_types(TYPE_BITS['Token'])
 
     def total_cost(self) -> int:
         '''
@@ -2229,12 +2595,9 @@ class CardList(UserList):
         Returns:
           The total cost of all cards in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.cost for x in self.data if isinstance(x.cost, int)]
-        if array:
-            return sum(array)
-        else:
-            return 0
+        values = self._valid_values('cost')
+        if not values.size: return 0
+        return int(values.sum())
 
     def total_defense(self) -> int:
         '''
@@ -2246,12 +2609,9 @@ class CardList(UserList):
         Returns:
           The total defense of all cards in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.defense for x in self.data if isinstance(x.defense, int)]
-        if array:
-            return sum(array)
-        else:
-            return 0
+        values = self._valid_values('defense')
+        if not values.size: return 0
+        return int(values.sum())
 
     def total_health(self) -> int:
         '''
@@ -2263,12 +2623,9 @@ class CardList(UserList):
         Returns:
           The total health of all cards in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.health for x in self.data if isinstance(x.health, int)]
-        if array:
-            return sum(array)
-        else:
-            return 0
+        values = self._valid_values('health')
+        if not values.size: return 0
+        return int(values.sum())
 
     def total_intelligence(self) -> int:
         '''
@@ -2280,12 +2637,9 @@ class CardList(UserList):
         Returns:
           The total intelligence of all cards in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.intelligence for x in self.data if isinstance(x.intelligence, int)]
-        if array:
-            return sum(array)
-        else:
-            return 0
+        values = self._valid_values('intelligence')
+        if not values.size: return 0
+        return int(values.sum())
 
     def total_pitch(self) -> int:
         '''
@@ -2297,12 +2651,9 @@ class CardList(UserList):
         Returns:
           The total pitch value of all cards in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.pitch for x in self.data if isinstance(x.pitch, int)]
-        if array:
-            return sum(array)
-        else:
-            return 0
+        values = self._valid_values('pitch')
+        if not values.size: return 0
+        return int(values.sum())
 
     def total_power(self) -> int:
         '''
@@ -2314,12 +2665,57 @@ class CardList(UserList):
         Returns:
           The total attack power of all cards in the list.
         '''
-        if len(self.data) < 1: return 0
-        array = [x.power for x in self.data if isinstance(x.power, int)]
-        if array:
-            return sum(array)
+        values = self._valid_values('power')
+        if not values.size: return 0
+        return int(values.sum())
+
+    def _subset(self, indices: Any, clone: bool = False) -> CardList:
+        '''
+        Creates a new list of cards from the cards at the specified indices
+        of this list, carrying over any cached columns rather than rebuilding
+        them from the selected cards.
+
+        Args:
+          indices: A `slice`, a boolean mask aligned with `data`, or a sequence of integer indices into `data`.
+          clone: Whether to copy each selected card (see `Card._clone()`).
+
+        Returns:
+          A new `CardList` object.
+        '''
+        data = self.data
+        if isinstance(indices, slice):
+            selected = data[indices]
         else:
-            return 0
+            # Boolean masks are converted to indices once up front, so that
+            # each cached column is gathered at the selected positions only.
+            if isinstance(indices, np.ndarray) and indices.dtype == np.bool_:
+                indices = np.flatnonzero(indices)
+            else:
+                indices = np.asarray(indices, dtype=np.intp)
+            selected = [data[i] for i in indices.tolist()]
+        res = CardList([c._clone() for c in selected] if clone else selected)
+        for k, v in self._cache.items():
+            if isinstance(v, np.ndarray):
+                res._cache[k] = v[indices]
+            elif isinstance(v, tuple):
+                res._cache[k] = tuple(a[indices] for a in v)
+        return res
+
+    def _type_bits(self) -> np.ndarray:
+        '''
+        Returns an array containing the bitwise OR of the `TYPE_BITS` values
+        of the types of each card in this list.
+
+        Returns:
+          A `uint32` array aligned with `data`.
+        '''
+        if not 'type_bits' in self._cache:
+            self._cache['type_bits'] = np.fromiter(
+                (card._types_mask for card in self.data),
+                dtype = np.uint32,
+                count = len(self.data)
+            )
+        return self._cache['type_bits']
 
     def types(self) -> list[str]:
         '''
@@ -2328,10 +2724,7 @@ class CardList(UserList):
         Returns:
           The unique `list` of all card types in the list.
         '''
-        res = []
-        for card in self.data:
-            res.extend(card.types)
-        return sorted(list(set(res)))
+        return list(self._memoize('keys:types', lambda: sorted(self._list_index('types'))))
 
     def type_texts(self) -> list[str]:
         '''
@@ -2340,7 +2733,61 @@ class CardList(UserList):
         Returns:
           The unique `list` of all card types in the list.
         '''
-        return sorted(list(set([card.type_text for card in self.data])))
+        return list(self._memoize('keys:type_texts', lambda: sorted(set(map(operator.attrgetter('type_text'), self.data)))))
+
+    def _valid_values(self, field: str) -> np.ndarray:
+        '''
+        Returns the integer values of the specified numeric field of each card
+        in this list, skipping any `None` or `str` values.
+
+        Note:
+          When every card has an integer value (the common case for a deck),
+          the cached column is returned as-is rather than being masked.
+
+        Args:
+          field: The numeric `Card` field to fetch (see `VALUE_FIELDS`).
+
+        Returns:
+          An `int64` array of the integer values of the field.
+        '''
+        values, valid = self._value_column(field)
+        return values if valid.all() else values[valid]
+
+    def _value_column(self, field: str) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        Returns the (cached) values of the specified numeric field of each card
+        in this list.
+
+        Args:
+          field: The numeric `Card` field to fetch (see `VALUE_FIELDS`).
+
+        Returns:
+          An `int64` array of the values of the field, along with a `bool`
+          array indicating which of those values are actually integers (`None`
+          and `str` values are stored as `0`).
+        '''
+        key = 'values:' + field
+        if not key in self._cache:
+            self._cache[key] = _value_arrays(field, list(map(operator.attrgetter(field), self.data)))
+        return self._cache[key]
+
+    def _value_columns(self) -> None:
+        '''
+        Caches the values of every numeric field of each card in this list (see
+        `_value_column()`), gathering the fields of each card in a single pass
+        over the list.
+        '''
+        fields = sorted(f for f in VALUE_FIELDS if not 'values:' + f in self._cache)
+        if not fields: return
+        if len(fields) == 1:
+            self._value_column(fields[0])
+            return
+        if len(self.data) == 0:
+            raws = [()] * len(fields)
+        else:
+            raws = zip(*map(operator.attrgetter(*fields), self.data))
+        for field, raw in zip(fields, raws):
+            self._cache['values:' + field] = _value_arrays(field, list(raw))
 
     def weapons(self) -> CardList:
         '''
@@ -2349,4 +2796,4 @@ class CardList(UserList):
         Returns:
           The set of all weapon cards in the list.
         '''
-        return CardList([card for card in self.data if card.is_weapon()])
+        return self._select_types(TYPE_BITS['Weapon'])
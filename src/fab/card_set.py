@@ -4,19 +4,17 @@ Contains the definition of a Flesh and Blood card set.
 
 from __future__ import annotations
 
-import copy
 import csv
 import dataclasses
 import datetime
 import io
+import itertools
 import json
 import os
 
 from collections import UserDict
 from pandas import DataFrame
-from typing import Any, Optional
-
-from IPython.utils.text import indent
+from typing import Any, ClassVar, Optional
 
 from .card import Card
 
@@ -42,6 +40,17 @@ class CardSet:
     name: str
     release_date: Optional[datetime.date]
 
+    # `dataclass(slots=True)` requires Python 3.10, so the slots are declared
+    # manually.
+    __slots__ = (
+        'editions',
+        'identifier',
+        'name',
+        'release_date',
+    )
+
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]
+
     def __getitem__(self, key: str) -> Any:
         '''
         Allows one to access fields of a card set via dictionary syntax.
@@ -52,7 +61,8 @@ class CardSet:
         Returns:
           The value of the associated `CardSet` field.
         '''
-        return self.__dict__[key]
+        if not key in CardSet._FIELD_NAMES: raise KeyError(key)
+        return getattr(self, key)
 
     def __hash__(self) -> Any:
         '''
@@ -81,7 +91,7 @@ class CardSet:
         Returns:
           A `list` of dictionary keys associated with the fields of the set.
         '''
-        return list(self.__dict__.keys())
+        return list(CardSet._FIELD_NAMES)
 
     @staticmethod
     def from_datestr_dict(jsondict: dict[str, Any]) -> CardSet:
@@ -95,7 +105,7 @@ class CardSet:
         Returns:
           A new `CardSet` object.
         '''
-        rep = copy.deepcopy(jsondict)
+        rep = dict(jsondict, editions=list(jsondict['editions']))
         if not rep['release_date'] is None:
             rep['release_date'] = datetime.datetime.strptime(rep['release_date'], DATE_FORMAT).date()
         return CardSet(**rep)
@@ -121,7 +131,8 @@ class CardSet:
         Returns:
           A raw `dict` representing the card set.
         '''
-        rep = copy.deepcopy(self.__dict__)
+        rep = {k: getattr(self, k) for k in CardSet._FIELD_NAMES}
+        rep['editions'] = list(self.editions)
         if not rep['release_date'] is None:
             rep['release_date'] = rep['release_date'].strftime(DATE_FORMAT)
         return rep
@@ -135,6 +146,8 @@ class CardSet:
         '''
         return json.dumps(self.to_datestr_dict(), indent=JSON_INDENT)
 
+CardSet._FIELD_NAMES = tuple(f.name for f in dataclasses.fields(CardSet))
+
 
 class CardSetCollection(UserDict):
     '''
@@ -157,10 +170,7 @@ class CardSetCollection(UserDict):
         Returns:
           A unique `list` of all card set editions within the set collection.
         '''
-        res = []
-        for cs in self.data.values():
-            res.extend(cs.editions)
-        return list(set(res))
+        return list(set(itertools.chain.from_iterable(cs.editions for cs in self.data.values())))
 
     @staticmethod
     def from_csv(csvstr: str, delimiter: str = '\t') -> CardSetCollection:
@@ -231,11 +241,8 @@ class CardSetCollection(UserDict):
           The release date of the specified card, or `None` if not found.
         '''
         if len(self.data) < 1: return None
-        release_dates = [s.release_date for i, s in self.data.items() if i in card.sets and not s.release_date is None]
-        if release_dates:
-            return sorted(release_dates)[0]
-        else:
-            return None
+        card_sets = (self.data.get(i) for i in card.sets)
+        return min((s.release_date for s in card_sets if not s is None and not s.release_date is None), default=None)
 
     def identifiers(self) -> list[str]:
         '''
@@ -282,7 +289,7 @@ class CardSetCollection(UserDict):
         Returns:
           A unique `list` of all card set names within the collection.
         '''
-        return list(set([cs.name for cs in self.data.values()]))
+        return list({cs.name for cs in self.data.values()})
 
     def release_dates(self) -> list[datetime.date]:
         '''
@@ -292,9 +299,7 @@ class CardSetCollection(UserDict):
         Returns:
           A unique `list` of all card set release dates within the collection.
         '''
-        return sorted(list(set(
-            [cs.release_date for cs in self.data.values() if not cs.release_date is None]
-        )))
+        return sorted({cs.release_date for cs in self.data.values() if not cs.release_date is None})
 
     def save(self, file_path: str):
         '''
@@ -11,10 +11,9 @@ import os
 import random
 import requests
 
-from IPython.display import display, Markdown
 from typing import Any, Optional
 
-from .card import Card, CardList
+from .card import TYPE_BITS, Card, CardList, json_default
 from .meta import GAME_FORMATS
 
 EXCLUDE_TYPES: list[str] = [
@@ -264,9 +263,10 @@ class Deck:
         # adding 1 token.
         for token in related.filter(types='Token'):
             if not token in curr_tokens:
-                if any(token.name.lower() in card.body.lower() for card in curr_deck if isinstance(card.body, str)):
+                token_name = token._name_lower
+                if any(token_name in card._body_lower for card in curr_deck if isinstance(card.body, str)):
                     curr_tokens.append(token)
-                elif isinstance(self.hero.body, str) and token.name.lower() in self.hero.body.lower():
+                elif isinstance(self.hero.body, str) and token_name in self.hero._body_lower:
                     curr_tokens.append(token)
         # Now replace our current field values.
         self.cards     = curr_deck.sort()
@@ -398,13 +398,13 @@ class Deck:
         '''
         data = json.loads(jsonstr)
         return Deck(
-            cards     = CardList([Card(**c) for c in data['cards']]),
+            cards     = CardList([Card.from_dict(c) for c in data['cards']]),
             format    = data['format'],
-            hero      = Card(**data['hero']),
-            inventory = CardList([Card(**c) for c in data['inventory']]),
+            hero      = Card.from_dict(data['hero']),
+            inventory = CardList([Card.from_dict(c) for c in data['inventory']]),
             name      = data['name'],
             notes     = data.get('notes'),
-            tokens    = CardList([Card(**c) for c in data['tokens']])
+            tokens    = CardList([Card.from_dict(c) for c in data['tokens']])
         )
 
     def is_valid(
@@ -449,21 +449,23 @@ class Deck:
           A `tuple` of the form `(<answer>, <reason>)`.
         '''
         all_cards = self.all_cards()
+        hero_types = frozenset(self.hero.types)
         # Common
         if not self.format in GAME_FORMATS: return (False, f'Common: Specified deck format code is not one of {list(GAME_FORMATS.keys())}.')
         if not ignore_size_limits and len(self.cards) < 1: return (False, 'Common: Deck does not contain any "main" cards.')
-        if any(card.is_equipment() or card.is_weapon() or card.is_hero() for card in self.cards): return (False, 'Common: Main deck contains invalid cards (like equipment) - move these cards to their appropriate field, even when playing Classic Constructed.')
+        if (self.cards._type_bits() & (TYPE_BITS['Equipment'] | TYPE_BITS['Hero'] | TYPE_BITS['Weapon'])).any(): return (False, 'Common: Main deck contains invalid cards (like equipment) - move these cards to their appropriate field, even when playing Classic Constructed.')
         if not ignore_inv_size_limits and len(self.inventory) < 1: return (False, 'Common: Deck does not contain any inventory cards.')
-        if any(not (card.is_equipment() or card.is_weapon()) for card in self.inventory): return (False, 'Common: Inventory deck contains non-equipment/weapon cards - move these cards to their appropriate field.')
+        if not (self.inventory._type_bits() & (TYPE_BITS['Equipment'] | TYPE_BITS['Weapon'])).all(): return (False, 'Common: Inventory deck contains non-equipment/weapon cards - move these cards to their appropriate field.')
         if not self.hero.is_hero(): return (False, 'Common: Deck `hero` is not a hero card.')
         if not ignore_hero_legality:
             if not self.hero.is_legal(self.format): return (False, f'{GAME_FORMATS[self.format]}: Hero "{self.hero.name}" is not currently legal in this format.')
-        if any(not card.is_token() for card in self.tokens): return (False, 'Common: Token deck contains non-token cards - move these cards to their appropriate field.')
-        if not 'Shapeshifter' in self.hero.types:
+        if not (self.tokens._type_bits() & TYPE_BITS['Token']).all(): return (False, 'Common: Token deck contains non-token cards - move these cards to their appropriate field.')
+        if not 'Shapeshifter' in hero_types:
             valid_types = self.valid_types()
+            valid_type_set = frozenset(valid_types)
             for card in self.all_cards(include_tokens=True):
                 if card == self.hero: continue
-                if not any(t in valid_types for t in card.types): return (False, f'Common: Card "{card.full_name}" is not one of the following types: {valid_types}')
+                if valid_type_set.isdisjoint(card.types): return (False, f'Common: Card "{card.full_name}" is not one of the following types: {valid_types}')
         if not ignore_legality:
             for card in all_cards:
                 if card == self.hero: continue
@@ -474,7 +476,7 @@ class Deck:
                 return (False, 'Blitz: Main deck may only contain 40 cards.')
             if not ignore_inv_size_limits and len(self.inventory) > 11:
                 return (False, 'Blitz: Inventory deck may not contain more than 11 cards.')
-            if not 'Young' in self.hero.types:
+            if not 'Young' in hero_types:
                 return (False, 'Blitz: Deck must use a "young" hero.')
             if not ignore_copy_limits and any(v > 2 for v in all_cards.counts().values()):
                 return (False, 'Blitz: Only up to two copies of each unique card are allowed.')
@@ -483,7 +485,7 @@ class Deck:
                 return (False, 'Commoner: Main deck may only contain 40 cards.')
             if not ignore_inv_size_limits and len(self.inventory) > 11:
                 return (False, 'Commoner: Inventory deck may not contain more than 11 cards.')
-            if not 'Young' in self.hero.types:
+            if not 'Young' in hero_types:
                 return (False, 'Commoner: Deck must use a "young" hero.')
             if not ignore_copy_limits and any(v > 2 for v in all_cards.counts().values()):
                 return (False, 'Commoner: Only up to two copies of each unique card are allowed.')
@@ -508,7 +510,7 @@ class Deck:
         elif self.format == 'D':
             if not ignore_size_limits and len(self.cards) < 30:
                 return (False, 'Draft: Main deck must contain at least 30 cards.')
-            if not 'Young' in self.hero.types:
+            if not 'Young' in hero_types:
                 return (False, 'Draft: Deck must use a "young" hero.')
         elif self.format == 'UPF':
             return (True, 'Ultimate Pit Fight: Warning, UPF has not been implemented, only common checks have been validated.')
@@ -562,6 +564,7 @@ class Deck:
           The IPython-rendered markdown output.
         '''
         if not self.notes is None:
+            from IPython.display import display, Markdown
             return display(Markdown(self.notes))
         else:
             raise Exception('specified deck does not contain any notes')
@@ -575,7 +578,7 @@ class Deck:
         '''
         with open(os.path.expanduser(file_path), 'w') as f:
             if file_path.endswith('.json'):
-                f.write(self.to_json())
+                json.dump(self._to_json_dict(), f, default=json_default, indent=JSON_INDENT)
             elif file_path.endswith('.txt'):
                 for k, v in self.to_deck_list():
                     f.write(f'{v} {k}\n')
@@ -712,7 +715,28 @@ class Deck:
         Returns:
           The JSON string representation of the deck.
         '''
-        return json.dumps(self.to_dict(), indent=JSON_INDENT)
+        return json.dumps(self._to_json_dict(), default=json_default, indent=JSON_INDENT)
+
+    def _to_json_dict(self) -> dict[str, Any]:
+        '''
+        Returns the raw dictionary to serialize this deck from.
+
+        Note:
+          Unlike `to_dict()`, the cards of the deck are not converted, so the
+          result must be encoded with `card.json_default()`.
+
+        Returns:
+          A `dict` referencing the fields of the deck.
+        '''
+        return {
+            'cards': self.cards,
+            'format': self.format,
+            'hero': self.hero,
+            'inventory': self.inventory,
+            'name': self.name,
+            'notes': self.notes,
+            'tokens': self.tokens
+        }
 
     def valid_types(self, include_generic: bool = True) -> list[str]:
         '''
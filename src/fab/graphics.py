@@ -4,6 +4,7 @@ Contains definitions associated with plotting/drawing card data.
 
 import copy
 import datetime
+import operator
 import statistics
 import pandas as pd
 import plotly.figure_factory as ff
@@ -319,12 +320,14 @@ def scatter_plot(
     '''
     fig = go.Figure()
     num_traces = 0
+    xaxis_title, yaxis_title = VALUE_TITLE[x], VALUE_TITLE[y]
+    get_xy = operator.attrgetter(x, y)
     grouped_data = cards.group(by=by) if not by is None else {'all': cards}
     for category, data in grouped_data.items():
         if only and not category in only: continue
-        xydata: list[tuple[int, int]] = list(set(
-            (card[x], card[y]) for card in data if isinstance(card[x], int) and isinstance(card[y], int)
-        ))
+        xydata: list[tuple[int, int]] = list({
+            xy for xy in map(get_xy, data.data) if isinstance(xy[0], int) and isinstance(xy[1], int)
+        })
         hovertexts: list[str] = []
         for (xd, yd) in xydata:
             hovertexts.append(__compute_hovertext(
@@ -341,8 +344,8 @@ def scatter_plot(
     fig.update_layout(
         showlegend  = num_traces > 1,
         title       = title,
-        xaxis_title = VALUE_TITLE[x],
-        yaxis_title = VALUE_TITLE[y]
+        xaxis_title = xaxis_title,
+        yaxis_title = yaxis_title
     )
     return fig
 
@@ -425,14 +428,13 @@ def table(cards: CardList, columns: list[str] = ['name', 'type_text', 'cost', 'd
       A Plotly figure representing the table data.
     '''
     fig = go.Figure()
-    cells = []
-    for column in columns:
-        c = [card[column] for card in cards]
-        cells.append(c)
+    titles = [VALUE_TITLE[column] for column in columns]
+    data = cards.data
+    cells = [list(map(operator.attrgetter(column), data)) for column in columns]
     fig.add_trace(go.Table(
         header = {
             'align': 'left',
-            'values': [VALUE_TITLE[column] for column in columns],
+            'values': titles,
         },
         cells = {
             'align': 'left',
@@ -4,13 +4,14 @@ Contains definitions associated with tracking personal card inventories.
 
 from __future__ import annotations
 
-import copy
 import dataclasses
+import itertools
 import json
 import os
+import sys
 
 from collections import UserDict
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from .card import Card, CardList
 from .meta import EDITIONS, FOILINGS, RARITIES
@@ -27,6 +28,11 @@ class InventoryItem:
       Unlike normal `Card` objects, `InventoryItem` objects represent a
       card's unique identifier, edition, rarity, and foiling.
 
+    Note:
+      The hash of an inventory item is computed once when it is constructed,
+      so `InventoryItem` objects should be treated as read-only (they are
+      used as the keys of `CardInventory` objects).
+
     Attributes:
       edition: The edition code associated with the card (see `meta.EDITIONS`).
       foiling: The foiling code associated with the card (see `meta.FOILINGS`).
@@ -38,6 +44,8 @@ class InventoryItem:
     edition: str = 'U'
     foiling: str = 'S'
 
+    _FIELD_NAMES: ClassVar[tuple[str, ...]]
+
     def __getitem__(self, key: str) -> str:
         '''
         Allows one to access fields of an inventory item via dictionary syntax.
@@ -48,16 +56,23 @@ class InventoryItem:
         Returns:
           The value associated with the specified field.
         '''
-        return self.__dict__[key]
+        if not key in InventoryItem._FIELD_NAMES: raise KeyError(key)
+        return getattr(self, key)
 
     def __hash__(self) -> Any:
         '''
-        Computes the hash representation of the inventory item.
+        Returns the (precomputed) hash representation of the inventory item.
 
         Returns:
           The hash representation of the inventory item.
         '''
-        return hash((self.edition, self.foiling, self.identifier, self.rarity))
+        return self._hash
+
+    def __post_init__(self):
+        '''
+        Precomputes the hash of the inventory item.
+        '''
+        self._hash = hash((self.edition, self.foiling, self.identifier, self.rarity))
 
     def __str__(self) -> str:
         '''
@@ -129,10 +144,10 @@ class InventoryItem:
         if not len(parts) == 4:
             raise ValueError('specified string not of the form "EDITION-IDENTIFIER-RARITY-FOILING"')
         return InventoryItem(
-            edition = parts[0],
-            foiling = parts[3],
-            identifier = parts[1],
-            rarity = parts[2]
+            edition = sys.intern(parts[0]),
+            foiling = sys.intern(parts[3]),
+            identifier = sys.intern(parts[1]),
+            rarity = sys.intern(parts[2])
         )
 
     def keys(self) -> list[str]:
@@ -142,7 +157,7 @@ class InventoryItem:
         Returns:
           The `dict` keys as `list[str]`, corresponding to the possible fields of the inventory item.
         '''
-        return list(self.__dict__.keys())
+        return list(InventoryItem._FIELD_NAMES)
 
     def to_card(self, catalog: Optional[CardList] = None) -> Card:
         '''
@@ -168,7 +183,7 @@ class InventoryItem:
         Returns:
           A copy of the raw `dict` representation of the inventory item.
         '''
-        return copy.deepcopy(self.__dict__)
+        return {k: getattr(self, k) for k in InventoryItem._FIELD_NAMES}
 
     def to_json(self) -> str:
         '''
@@ -212,6 +227,8 @@ class InventoryItem:
         '''
         return (self.edition, self.foiling, self.identifier, self.rarity)
 
+InventoryItem._FIELD_NAMES = tuple(f.name for f in dataclasses.fields(InventoryItem))
+
 class CardInventory(UserDict):
     '''
     Represents an inventory of unique Flesh and Blood cards.
@@ -288,10 +305,7 @@ class CardInventory(UserDict):
         '''
         if count <= 0:
             raise ValueError('specified count is not a positive integer value')
-        if not item in self:
-            self[item] = count
-        else:
-            self[item] += count
+        self.data[item] = self.data.get(item, 0) + count
 
     def count(self) -> int:
         '''
@@ -324,10 +338,7 @@ class CardInventory(UserDict):
         Returns:
           A unique `list` of all card set edition codes contained in the card inventory.
         '''
-        res = []
-        for i in self.data.keys():
-            res.append(i.edition)
-        return list(set(res))
+        return list({i.edition for i in self.data})
 
     def foiling_counts(self) -> dict[str, int]:
         '''
@@ -351,10 +362,7 @@ class CardInventory(UserDict):
         Returns:
           A unique `list` of all card set foiling codes contained in the card inventory.
         '''
-        res = []
-        for i in self.data.keys():
-            res.append(i.foiling)
-        return list(set(res))
+        return list({i.foiling for i in self.data})
 
     @staticmethod
     def from_dict(data: dict[str, int]) -> CardInventory:
@@ -367,10 +375,7 @@ class CardInventory(UserDict):
         Returns:
           A new `CardInventory` from the parsed data.
         '''
-        res = {}
-        for k, v in data.items():
-            res[InventoryItem.from_str(k)] = v
-        return CardInventory(res)
+        return CardInventory({InventoryItem.from_str(k): v for k, v in data.items()})
 
     @staticmethod
     def from_json(jsonstr: str) -> CardInventory:
@@ -407,10 +412,7 @@ class CardInventory(UserDict):
         Returns:
           A unique `list` of all card set identifiers contained in the card inventory.
         '''
-        res = []
-        for i in self.data.keys():
-            res.append(i.identifier)
-        return list(set(res))
+        return list({i.identifier for i in self.data})
 
     @staticmethod
     def load(file_path: str) -> CardInventory:
@@ -425,7 +427,7 @@ class CardInventory(UserDict):
         '''
         with open(os.path.expanduser(file_path), 'r') as f:
             if file_path.endswith('.json'):
-                return CardInventory.from_json(f.read())
+                return CardInventory.from_dict(json.load(f))
             else:
                 raise Exception('specified file path is not a JSON file')
 
@@ -470,10 +472,7 @@ class CardInventory(UserDict):
         Returns:
           A unique `list` of all card set rarity codes contained in the card inventory.
         '''
-        res = []
-        for i in self.data.keys():
-            res.append(i.rarity)
-        return list(set(res))
+        return list({i.rarity for i in self.data})
 
     def rarity_counts(self) -> dict[str, int]:
         '''
@@ -499,7 +498,7 @@ class CardInventory(UserDict):
         '''
         with open(os.path.expanduser(file_path), 'w') as f:
             if file_path.endswith('.json'):
-                f.write(self.to_json())
+                json.dump(self.to_dict(), f, indent=JSON_INDENT)
             else:
                 raise Exception('specified file path is not a JSON file')
 
@@ -584,11 +583,9 @@ class CardInventory(UserDict):
         Returns:
           A `CardList` object containing the generic represenations of the cards contained within this inventory.
         '''
-        cards = []
-        for k, v in self.data.items():
-            for _ in range(0, v):
-                cards.append(k.to_card(catalog=catalog))
-        return CardList(cards)
+        return CardList(itertools.chain.from_iterable(
+            itertools.repeat(k.to_card(catalog=catalog), v) for k, v in self.data.items() if v > 0
+        ))
 
     def to_dict(self) -> dict[str, int]:
         '''
@@ -598,10 +595,7 @@ class CardInventory(UserDict):
         Returns:
           A raw `dict` representation of the card inventory.
         '''
-        data = {}
-        for k, v in self.data.items():
-            data[k.to_str()] = v
-        return data
+        return {k.to_str(): v for k, v in self.data.items()}
 
     def to_json(self) -> str:
         '''
@@ -2,6 +2,8 @@
 Tests `Card` and `CardList` objects.
 '''
 
+import pytest
+
 from fab import Card, CardList
 
 from . import (
@@ -70,6 +72,11 @@ def test_card_json_conversion():
     C1_from_json = Card.from_json(C1_json)
     assert C1_json == C1_str
     assert C1_from_json == C1
+    assert Card.from_dict(C1.to_dict()) == C1
+    misspelled = C1.to_dict()
+    misspelled['nmae'] = misspelled.pop('name')
+    with pytest.raises(TypeError):
+        Card.from_dict(misspelled)
 
 def test_card_methods():
     '''
@@ -156,6 +163,8 @@ def test_card_list_collections():
     assert set(CL1.intelligence_values()) == set([4])
     assert set(CL1.keywords()) == set(['Bravo Specialization', 'Crush', 'Go again'])
     assert set(CL1.names()) == set(['Crippling Crush', 'Flic Flak', 'Chane'])
+    CL1.names().append('Anothos')
+    assert set(CL1.names()) == set(['Crippling Crush', 'Flic Flak', 'Chane'])
     assert set(CL1.pitch_values()) == set([1, 2])
     assert set(CL1.power_values()) == set([11])
     assert set(CL1.rarities()) == set(['M', 'R', 'P', 'T'])
@@ -187,6 +196,10 @@ def test_card_list_filtering():
     # cost
     assert set(CL1.filter(cost=7))                              == set([C1])
     assert set(CL1.filter(cost=7, negate=True))                    == set([C2, C3])
+    # deep
+    assert CL1.filter(cost=7)[0] is CL1[0]
+    assert CL1.filter(cost=7, deep=True)[0] is not CL1[0]
+    assert CL1.filter(cost=7, deep=True)[0] == CL1[0]
     # defense
     assert set(CL1.filter(defense=3))                           == set([C1, C2])
     assert set(CL1.filter(defense=3, negate=True))                 == set([C3])
@@ -205,6 +218,13 @@ def test_card_list_filtering():
     # keywords
     assert set(CL1.filter(keywords='Crush'))                    == set([C1])
     assert set(CL1.filter(keywords='Crush', negate=True))          == set([C2, C3])
+    # legality
+    assert set(CL1.filter(legality='B'))                        == set([C1, C2, C3])
+    assert not CL1.filter(legality='B', negate=True)
+    partial = CL1.filter(deep=True)
+    partial[0].legality['D'] = False
+    assert len(partial.filter(legality='D'))                    == 2
+    assert partial.filter(legality='D', negate=True).full_names() == ['Crippling Crush (1)']
     # name
     assert set(CL1.filter(name='Chane'))                        == set([C3])
     assert set(CL1.filter(name='Chane', negate=True))              == set([C1, C2])
@@ -219,9 +239,16 @@ def test_card_list_filtering():
     # sets
     assert set(CL1.filter(sets='MON'))                          == set([C3])
     assert set(CL1.filter(sets='MON', negate=True))                == set([C1, C2])
+    assert set(CL1.filter(sets=['CHN', 'HER']))                 == set([C3])
+    assert set(CL1.filter(sets=['CHN', 'HER'], negate=True))       == set([C1, C2])
     # tags
     assert set(CL1.filter(tags='example-1'))                    == set([C1])
     assert set(CL1.filter(tags='example-1', negate=True))          == set([C2, C3])
+    tagged = CL1.filter(deep=True)
+    assert not tagged.filter(tags='example-4')
+    tagged[1].tags.append('example-4')
+    assert tagged.filter(tags='example-4').full_names()         == ['Flic Flak (2)']
+    assert tagged.filter(tags=['example-4']).full_names()       == ['Flic Flak (2)']
     # type text
     assert set(CL1.filter(type_text='Hero'))                    == set([C3])
     assert set(CL1.filter(type_text='Hero', negate=True))          == set([C1, C2])
@@ -251,8 +278,12 @@ def test_card_list_methods():
     Tests common `list` methods on cards.
     '''
     CL_append = CardList([C1, C2])
+    assert CL_append.heroes() == CardList([])
     CL_append.append(C3)
     assert CL_append == CardList([C1, C2, C3])
+    assert CL_append.heroes() == CardList([C3])
+    assert CL_append.attacks() == CardList([C1])
+    assert CL_append.reactions() == CardList([C2])
     CL_extend = CardList([C1])
     CL_extend.extend(CardList([C2, C3]))
     assert CL_extend == CardList([C1, C2, C3])
@@ -260,6 +291,10 @@ def test_card_list_methods():
     C3_popped = CL_pop.pop()
     assert C3_popped == C3
     assert CL_pop == CardList([C1, C2])
+    assert C1 in CL_pop
+    assert not C3 in CL_pop
+    CL_pop.append(C3)
+    assert C3 in CL_pop
 
 def test_card_list_sorting():
     '''
@@ -270,6 +305,9 @@ def test_card_list_sorting():
     assert CL1.sort(key = 'sets') == CardList([C1, C2, C3])
     assert CL1.sort(key = 'types') == CardList([C2, C1, C3])
     assert CL1.sort(key = 'rarities') == CardList([C2, C3, C1])
+    assert CL1.sort()[1] is CL1[0]
+    assert CL1.sort(deep = True)[1] is not CL1[0]
+    assert CL1.sort(deep = True)[1] == CL1[0]
 
 def test_card_list_statistics():
     '''